@@ -89,6 +89,7 @@ class BaseVirtualEnvironment(object):
 
         self._requirements = None
         self._package_name = None
+        self._env_dir = None
         self._env_description = None
 
         self._have_setup_py = None
@@ -191,7 +192,9 @@ class BaseVirtualEnvironment(object):
     @property
     def env_dir(self):
         """Get the directory where this environment lives."""
-        return os.path.join(self.env_prefix, self.env_name)
+        if self._env_dir is None:
+            self._env_dir = os.path.join(self.env_prefix, self.env_name)
+        return self._env_dir
 
     @property
     def env_bin_dir(self):
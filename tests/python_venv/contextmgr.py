@@ -1,11 +1,20 @@
-"""Provide context managers for use in unit tests."""
+"""Provide context managers and shared data for use in unit tests."""
 
 import contextlib
+import functools
 import os
 import os.path
+import re
+import shutil
+import subprocess
 import sys
 import tempfile
+import types
+import venv
 from io import StringIO
+from unittest.mock import patch
+
+from python_venv import const, reqs
 
 
 @contextlib.contextmanager
@@ -81,6 +90,200 @@ def capture_output_to_file():
         sys.stderr = orig_stderr
 
 
+def capture_env(x, a_callable):
+    """
+    Capture status, stdout, and stderr from calling a method of environment `x`.
+
+    Capture to a file, since the call may start subprocesses (the file stays
+    in memory unless one does).  Look up the package name inside the
+    capture, too: that runs ``setup.py`` with our stderr, so its output is
+    captured and checked along with the call's own.
+    """
+
+    @functools.wraps(a_callable)
+    def call():
+        _ = x.package_name
+        return a_callable()
+
+    return capture_to_file(call)
+
+
+def environment_cache(env_class):
+    """
+    Return a callable that constructs `env_class` environments, sharing one
+    instance per distinct set of arguments.
+
+    Environments cache what they look up (e.g. the package name, which
+    runs ``setup.py``), so use this only for tests that read attributes,
+    and keep each cache to a single test class.
+    """
+    return functools.lru_cache(maxsize=None)(env_class)
+
+
+@functools.lru_cache(maxsize=None)
+def dry_run_stderr(env_class, verb, **kwargs):
+    """
+    Dry-run `verb` (``create``, ``remove``, or ``replace``) on an
+    `env_class` environment once and return what it wrote to stderr.
+
+    The dry-run message tests check several lines of the same output, so
+    each verb only needs to run once.  `kwargs` go to `env_class`.
+    """
+    dummy_requirements = {const.FROM_FILES: ["dummy_requirements.txt"]}
+    with patch.object(reqs, "REQUIREMENTS", {"dummy_req_scheme": [dummy_requirements]}):
+        x = env_class(
+            "dummy_req_scheme", dry_run=True, ignore_preflight_checks=True, **kwargs
+        )
+        with capture_env(x, getattr(x, verb)) as (_status, _stdout, stderr):
+            return stderr
+
+
+ERROR_PATTERN = re.compile(r"error", re.IGNORECASE)
+
+FILESPECS = types.MappingProxyType(
+    {
+        "requirements.txt": "argcomplete",
+        "requirements_dev.txt": "argcomplete",
+        "requirements_frozen.txt": "argcomplete == 1.12.3",
+        os.path.join("dev", "requirements_build.txt"): "",
+        os.path.join("dev", "requirements_dev.txt"): "",
+        os.path.join("dev", "requirements_test.txt"): "parameterized",
+    }
+)
+
+SCHEMES = (
+    ("plain", reqs.REQ_SCHEME_PLAIN, None, None, ()),
+    ("plain", reqs.REQ_SCHEME_PLAIN, None, "dummy-env", ()),
+    ("dev", reqs.REQ_SCHEME_DEV, None, None, ()),
+    ("devplus", reqs.REQ_SCHEME_DEVPLUS, None, None, ()),
+    ("frozen", reqs.REQ_SCHEME_FROZEN, None, None, ()),
+    ("source", reqs.REQ_SCHEME_SOURCE, None, None, ()),
+    ("wheel", reqs.REQ_SCHEME_WHEEL, None, None, ()),
+    ("package", reqs.REQ_SCHEME_PACKAGE, "argcomplete", None, ()),
+    ("pip", reqs.REQ_SCHEME_PIP, None, None, ("argcomplete",)),
+)
+
+
+def scheme_matrix(schemes):
+    """
+    Expand `schemes` into a dry-run and a real row for each scheme.
+
+    Each row of `schemes` is ``(name, req_scheme, basename, env_name,
+    ...)``; each resulting row is ``(test_name, req_scheme, dry_run,
+    basename, env_name, ...)``, with any further columns passed through.
+    """
+    return tuple(
+        (
+            name + ("_dry_run" if dry_run else "") + ("_env_name" if env_name else ""),
+            req_scheme,
+            dry_run,
+            basename,
+            env_name,
+            *rest,
+        )
+        for (name, req_scheme, basename, env_name, *rest) in schemes
+        for dry_run in (True, False)
+    )
+
+
+SCHEME_MATRIX = scheme_matrix(SCHEMES)
+
+
+@contextlib.contextmanager
+def prebuilt_venv():
+    """
+    Build a bare virtual environment to copy in wherever a test needs an
+    existing one, and remove it on exit.
+
+    Yields the path to the environment.
+    """
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env_dir = os.path.join(cache_dir, "venv")
+        venv.create(env_dir, symlinks=(os.name != "nt"))
+        yield env_dir
+
+
+def _fake_check_call(args, **_kwargs):
+    """
+    Stand in for `subprocess.check_call`:py:func: when creating environments.
+
+    Instead of running ``python -m venv ENV_DIR``, create just enough of
+    ``ENV_DIR`` for the environment to exist; pretend every other command
+    (e.g. ``pip install``) succeeded.
+    """
+    if list(args[1:3]) == ["-m", "venv"]:
+        os.makedirs(os.path.join(args[3], "bin"))
+    return 0
+
+
+_check_output = subprocess.check_output
+
+
+def _fake_check_output(args, **kwargs):
+    """
+    Stand in for `subprocess.check_output`:py:func: when creating environments.
+
+    Pretend that ``python -m build ...`` built an sdist and a wheel; run
+    every other command (e.g. ``python setup.py --name``) for real.
+    """
+    if list(args[1:3]) == ["-m", "build"]:
+        return (
+            "Successfully built dummy_package-0.0.0.tar.gz"
+            " and dummy_package-0.0.0-py3-none-any.whl\n"
+        )
+    return _check_output(args, **kwargs)
+
+
+@contextlib.contextmanager
+def fake_venv_subprocesses():
+    """
+    Fake the ``venv``, ``pip``, and ``build`` subprocesses that creating a
+    virtual environment runs, so creating one touches neither the network
+    nor an interpreter.
+    """
+    with patch.multiple(
+        subprocess, check_call=_fake_check_call, check_output=_fake_check_output
+    ):
+        yield
+
+
+@contextlib.contextmanager
+def fake_pyenv_subprocesses():
+    """
+    Fake the ``pyenv``, ``pip``, and ``build`` subprocesses that creating a
+    pyenv virtual environment runs.
+
+    ``pyenv virtualenv`` creates the environment in a temporary stand-in for
+    pyenv's ``versions`` directory, where ``pyenv prefix`` finds it and
+    ``pyenv virtualenv-delete`` removes it; the directory goes away on exit.
+
+    Yields the path to the stand-in ``versions`` directory.
+    """
+    with tempfile.TemporaryDirectory() as versions_dir:
+
+        def fake_check_call(args, **kwargs):
+            if list(args[:2]) == ["pyenv", "virtualenv"]:
+                os.makedirs(os.path.join(versions_dir, args[-1], "bin"))
+                return 0
+            if list(args[:2]) == ["pyenv", "virtualenv-delete"]:
+                shutil.rmtree(os.path.join(versions_dir, args[-1]))
+                return 0
+            return _fake_check_call(args, **kwargs)
+
+        def fake_check_output(args, **kwargs):
+            if list(args[:2]) == ["pyenv", "prefix"]:
+                env_dir = os.path.join(versions_dir, args[-1])
+                if not os.path.isdir(env_dir):
+                    raise subprocess.CalledProcessError(1, args)
+                return env_dir + "\n"
+            return _fake_check_output(args, **kwargs)
+
+        with patch.multiple(
+            subprocess, check_call=fake_check_call, check_output=fake_check_output
+        ):
+            yield versions_dir
+
+
 PYPROJECT_TOML_TEMPLATE = """
 [build-system]
 requires = [
@@ -261,13 +464,22 @@ def project(
         with open(os.path.join(package_dir, "__init__.py"), "w"):
             pass  # empty file is ok
 
+        # Most files share a parent directory; create each one only once.
+        made_dirs = {os.curdir}
+
         for path in dirs:
             path = _ensure_relative_path(path)
-            os.makedirs(os.path.dirname(path), exist_ok=True)
+            parent = os.path.dirname(path)
+            if parent not in made_dirs:
+                os.makedirs(parent, exist_ok=True)
+                made_dirs.add(parent)
 
         for path, contents in filespecs.items():
             path = _ensure_relative_path(path)
-            os.makedirs(os.path.dirname(path), exist_ok=True)
+            parent = os.path.dirname(path)
+            if parent not in made_dirs:
+                os.makedirs(parent, exist_ok=True)
+                made_dirs.add(parent)
             with open(path, "w") as f:
                 if kwargs:
                     contents = contents.format(**kwargs)
@@ -1,7 +1,9 @@
 """Provide some flags and related functions for tests."""
 
+import functools
 import os
 import os.path
+import shutil
 import subprocess
 
 HERE = os.getcwd()
@@ -18,6 +20,7 @@ SKIP_LONG_RUNNING_MESSAGE = (
 )
 
 
+@functools.lru_cache(maxsize=None)
 def have_pyenv():
     """The ``pyenv`` command is available."""
     try:
@@ -36,20 +39,15 @@ def have_pyenv():
 
 def should_run_pyenv_tests():
     """We should run tests for pyenv environments."""
-    return have_pyenv() and not os.path.exists(
-        os.path.join(HERE, FLAG_TEST_WITHOUT_PYENV)
-    )
+    if os.path.exists(os.path.join(HERE, FLAG_TEST_WITHOUT_PYENV)):
+        return False  # don't bother running pyenv
+    return have_pyenv()
 
 
+@functools.lru_cache(maxsize=None)
 def have_conda():
     """The ``conda`` command is available."""
-    try:
-        subprocess.call(
-            ["conda", "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-        )
-    except FileNotFoundError:
-        return False
-    return True
+    return shutil.which("conda") is not None
 
 
 def should_run_conda_tests():
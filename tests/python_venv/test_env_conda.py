@@ -2,7 +2,9 @@
 
 import os
 import os.path
+import subprocess
 import unittest
+from unittest.mock import patch
 
 import parameterized  # https://pypi.org/project/parameterized/
 
@@ -12,17 +14,15 @@ from python_venv import reqs
 from tests.python_venv import contextmgr as ctx
 from tests.python_venv import flags
 
+ENV_PREFIX = ".conda-env"  # Must use env_prefix to avoid polluting conda envs
+DIRS = (ENV_PREFIX,)
+
+
 ########################################
 
 
 @unittest.skipUnless(flags.should_run_conda_tests(), flags.SKIP_CONDA_MESSAGE)
 class TestEnv_300_CondaEnvironment(unittest.TestCase):
-    def setUp(self):
-        self.saved_requirements = reqs.REQUIREMENTS
-
-    def tearDown(self):
-        reqs.REQUIREMENTS = self.saved_requirements
-
     def test_PV_ENV_CDA_000_instantiate_empty(self):
         with self.assertRaises(TypeError) as raised:
             env.CondaEnvironment()
@@ -68,9 +68,11 @@ class TestEnv_300_CondaEnvironment(unittest.TestCase):
 
     def test_PV_ENV_CDA_010_requirements(self):
         dummy_requirements = {"dummy_req_source": ["dummy_requirement"]}
-        reqs.REQUIREMENTS = {"dummy_req_scheme": [dummy_requirements]}
-        x = env.CondaEnvironment("dummy_req_scheme")
-        self.assertListEqual(x.requirements.requirements, [dummy_requirements])
+        with patch.object(
+            reqs, "REQUIREMENTS", {"dummy_req_scheme": [dummy_requirements]}
+        ):
+            x = env.CondaEnvironment("dummy_req_scheme")
+            self.assertListEqual(x.requirements.requirements, [dummy_requirements])
 
     def test_PV_ENV_CDA_020_package_name(self):
         x = env.CondaEnvironment("dummy_req_scheme")
@@ -152,33 +154,21 @@ class TestEnv_300_CondaEnvironment(unittest.TestCase):
 
     @parameterized.parameterized.expand(
         [
-            (
-                "default",
-                "dummy-basename",
-                None,
-                None,
-                os.path.join(os.getcwd(), "<ENV_DIR>"),
-            ),
-            (
-                "specified",
-                None,
-                "dummy-env",
-                None,
-                os.path.join(os.getcwd(), "<ENV_DIR>"),
-            ),
+            ("default", "dummy-basename", None, None, "<ENV_DIR>"),
+            ("specified", None, "dummy-env", None, "<ENV_DIR>"),
             (
                 "with_prefix",
                 "dummy-basename",
                 None,
                 "dummy-prefix",
-                os.path.join(os.getcwd(), "dummy-prefix", "dummy-basename"),
+                os.path.join("dummy-prefix", "dummy-basename"),
             ),
             (
                 "specified_with_prefix",
                 "dummy-basename",
                 "dummy-env",
                 "dummy-prefix",
-                os.path.join(os.getcwd(), "dummy-prefix", "dummy-env"),
+                os.path.join("dummy-prefix", "dummy-env"),
             ),
         ]
     )
@@ -193,7 +183,7 @@ class TestEnv_300_CondaEnvironment(unittest.TestCase):
         if env_prefix is not None:
             kwargs["env_prefix"] = env_prefix
         x = env.CondaEnvironment(reqs.REQ_SCHEME_PLAIN, dry_run=True, **kwargs)
-        self.assertEqual(x.abs_env_dir, expected)
+        self.assertEqual(x.abs_env_dir, os.path.join(os.getcwd(), expected))
 
     @parameterized.parameterized.expand(
         [
@@ -227,20 +217,22 @@ class TestEnv_300_CondaEnvironment(unittest.TestCase):
     )
     def test_PV_ENV_CDA_100_create_dry_run(self, name, kwargs, expected_text):
         dummy_requirements = {const.FROM_FILES: ["dummy_requirements.txt"]}
-        reqs.REQUIREMENTS = {"dummy_req_scheme": [dummy_requirements]}
-        x = env.CondaEnvironment(
-            "dummy_req_scheme",
-            dry_run=True,
-            basename="dummy-package",
-            ignore_preflight_checks=True,
-            **kwargs,
-        )
-        with ctx.capture(x.create) as (
-            status,
-            _stdout,
-            stderr,
+        with patch.object(
+            reqs, "REQUIREMENTS", {"dummy_req_scheme": [dummy_requirements]}
         ):
-            self.assertTrue(expected_text in stderr)
+            x = env.CondaEnvironment(
+                "dummy_req_scheme",
+                dry_run=True,
+                basename="dummy-package",
+                ignore_preflight_checks=True,
+                **kwargs,
+            )
+            with ctx.capture(x.create) as (
+                status,
+                _stdout,
+                stderr,
+            ):
+                self.assertTrue(expected_text in stderr)
 
     @parameterized.parameterized.expand(
         [
@@ -266,15 +258,17 @@ class TestEnv_300_CondaEnvironment(unittest.TestCase):
     )
     def test_PV_ENV_CDA_300_replace_dry_run(self, name, expected_text):
         dummy_requirements = {const.FROM_FILES: ["dummy_requirements.txt"]}
-        reqs.REQUIREMENTS = {"dummy_req_scheme": [dummy_requirements]}
-        x = env.CondaEnvironment(
-            "dummy_req_scheme",
-            dry_run=True,
-            basename="dummy-package",
-            ignore_preflight_checks=True,
-        )
-        with ctx.capture(x.replace) as (status, _stdout, stderr):
-            self.assertTrue(expected_text in stderr)
+        with patch.object(
+            reqs, "REQUIREMENTS", {"dummy_req_scheme": [dummy_requirements]}
+        ):
+            x = env.CondaEnvironment(
+                "dummy_req_scheme",
+                dry_run=True,
+                basename="dummy-package",
+                ignore_preflight_checks=True,
+            )
+            with ctx.capture(x.replace) as (status, _stdout, stderr):
+                self.assertTrue(expected_text in stderr)
 
 
 ########################################
@@ -288,55 +282,17 @@ class TestEnv_310_CondaCreate(unittest.TestCase):
     def tearDown(self):
         pass
 
-    @parameterized.parameterized.expand(
-        [
-            ("plain_dry_run", reqs.REQ_SCHEME_PLAIN, True, None, None, []),
-            ("plain", reqs.REQ_SCHEME_PLAIN, False, None, None, []),
-            (
-                "plain_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                "dummy-env",
-                [],
-            ),
-            ("plain_env_name", reqs.REQ_SCHEME_PLAIN, False, None, "dummy-env", []),
-            ("dev_dry_run", reqs.REQ_SCHEME_DEV, True, None, None, []),
-            ("dev", reqs.REQ_SCHEME_DEV, False, None, None, []),
-            ("devplus_dry_run", reqs.REQ_SCHEME_DEVPLUS, True, None, None, []),
-            ("devplus", reqs.REQ_SCHEME_DEVPLUS, False, None, None, []),
-            ("frozen_dry_run", reqs.REQ_SCHEME_FROZEN, True, None, None, []),
-            ("frozen", reqs.REQ_SCHEME_FROZEN, False, None, None, []),
-            ("source_dry_run", reqs.REQ_SCHEME_SOURCE, True, None, None, []),
-            ("source", reqs.REQ_SCHEME_SOURCE, False, None, None, []),
-            ("wheel_dry_run", reqs.REQ_SCHEME_WHEEL, True, None, None, []),
-            ("wheel", reqs.REQ_SCHEME_WHEEL, False, None, None, []),
-            ("package_dry_run", reqs.REQ_SCHEME_PACKAGE, True, "argcomplete", None, []),
-            ("package", reqs.REQ_SCHEME_PACKAGE, False, "argcomplete", None, []),
-            ("pip_dry_run", reqs.REQ_SCHEME_PIP, True, None, None, ["argcomplete"]),
-            ("pip", reqs.REQ_SCHEME_PIP, False, None, None, ["argcomplete"]),
-        ]
-    )
+    @parameterized.parameterized.expand(ctx.SCHEME_MATRIX)
     def test_PV_ENV_CDA_110_create(
         self, name, req_scheme, dry_run, basename, env_name, pip_args
     ):
-        env_prefix = ".conda-env"  # Must use env_prefix to avoid polluting conda envs
-        dirs = [env_prefix]
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", dirs=dirs, filespecs=filespecs):
+        with ctx.project("dummy_package", dirs=DIRS, filespecs=ctx.FILESPECS):
             x = env.CondaEnvironment(
                 req_scheme,
                 pip_args=pip_args,
                 basename=basename,
                 env_name=env_name,
-                env_prefix=env_prefix,
+                env_prefix=ENV_PREFIX,
                 dry_run=dry_run,
                 force=True,
             )
@@ -344,7 +300,7 @@ class TestEnv_310_CondaCreate(unittest.TestCase):
                 x.create()
             else:
                 original_stderr = None
-                with ctx.capture_to_file(x.create) as (
+                with ctx.capture_env(x, x.create) as (
                     _status,
                     _stdout,
                     stderr,
@@ -370,14 +326,12 @@ class TestEnv_310_CondaCreate(unittest.TestCase):
     def test_PV_ENV_CDA_120_create_missing_reqs(
         self, name, req_scheme, dry_run, basename, env_name
     ):
-        env_prefix = ".conda-env"
-        dirs = [env_prefix]
-        with ctx.project("dummy_package", dirs=dirs):
+        with ctx.project("dummy_package", dirs=DIRS):
             x = env.CondaEnvironment(
                 req_scheme,
                 basename=basename,
                 env_name=env_name,
-                env_prefix=env_prefix,
+                env_prefix=ENV_PREFIX,
                 dry_run=dry_run,
                 force=True,
             )
@@ -385,7 +339,7 @@ class TestEnv_310_CondaCreate(unittest.TestCase):
                 if not flags.should_suppress_output():
                     x.create()
                 else:
-                    with ctx.capture_to_file(x.create) as (
+                    with ctx.capture_env(x, x.create) as (
                         _status,
                         _stdout,
                         _stderr,
@@ -409,21 +363,11 @@ class TestEnv_310_CondaCreate(unittest.TestCase):
     def test_PV_ENV_CDA_130_create_duplicate(
         self, name, req_scheme, dry_run, env_name, should_raise
     ):
-        env_prefix = ".conda-env"
-        dirs = [env_prefix]
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", dirs=dirs, filespecs=filespecs):
+        with ctx.project("dummy_package", dirs=DIRS, filespecs=ctx.FILESPECS):
             x = env.CondaEnvironment(
                 req_scheme,
                 env_name=env_name,
-                env_prefix=env_prefix,
+                env_prefix=ENV_PREFIX,
                 dry_run=False,
                 force=True,
             )
@@ -435,7 +379,7 @@ class TestEnv_310_CondaCreate(unittest.TestCase):
             x = env.CondaEnvironment(
                 req_scheme,
                 env_name=env_name,
-                env_prefix=env_prefix,
+                env_prefix=ENV_PREFIX,
                 dry_run=dry_run,
                 force=True,
             )
@@ -474,55 +418,29 @@ class TestEnv_320_CondaRemove(unittest.TestCase):
     def tearDown(self):
         pass
 
-    @parameterized.parameterized.expand(
-        [
-            ("plain_dry_run", reqs.REQ_SCHEME_PLAIN, True, None, None, []),
-            ("plain", reqs.REQ_SCHEME_PLAIN, False, None, None, []),
-            (
-                "plain_dry_run_env_name",
+    def test_PV_ENV_CDA_205_remove_nonexistent(self):
+        with ctx.project("dummy_package", dirs=DIRS):
+            x = env.CondaEnvironment(
                 reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                "dummy-env",
-                [],
-            ),
-            ("plain_env_name", reqs.REQ_SCHEME_PLAIN, False, None, "dummy-env", []),
-            ("dev_dry_run", reqs.REQ_SCHEME_DEV, True, None, None, []),
-            ("dev", reqs.REQ_SCHEME_DEV, False, None, None, []),
-            ("devplus_dry_run", reqs.REQ_SCHEME_DEVPLUS, True, None, None, []),
-            ("devplus", reqs.REQ_SCHEME_DEVPLUS, False, None, None, []),
-            ("frozen_dry_run", reqs.REQ_SCHEME_FROZEN, True, None, None, []),
-            ("frozen", reqs.REQ_SCHEME_FROZEN, False, None, None, []),
-            ("source_dry_run", reqs.REQ_SCHEME_SOURCE, True, None, None, []),
-            ("source", reqs.REQ_SCHEME_SOURCE, False, None, None, []),
-            ("wheel_dry_run", reqs.REQ_SCHEME_WHEEL, True, None, None, []),
-            ("wheel", reqs.REQ_SCHEME_WHEEL, False, None, None, []),
-            ("package_dry_run", reqs.REQ_SCHEME_PACKAGE, True, "argcomplete", None, []),
-            ("package", reqs.REQ_SCHEME_PACKAGE, False, "argcomplete", None, []),
-            ("pip_dry_run", reqs.REQ_SCHEME_PIP, True, None, None, ["argcomplete"]),
-            ("pip", reqs.REQ_SCHEME_PIP, False, None, None, ["argcomplete"]),
-        ]
-    )
+                basename="dummy-package",
+                env_prefix=ENV_PREFIX,
+                force=True,
+            )
+            with ctx.capture(x.remove) as (_status, _stdout, stderr):
+                self.assertIn("Good news!", stderr)
+                self.assertNotIn("error", stderr.lower())
+
+    @parameterized.parameterized.expand(ctx.SCHEME_MATRIX)
     def test_PV_ENV_CDA_210_remove(
         self, name, req_scheme, dry_run, basename, env_name, pip_args
     ):
-        env_prefix = ".conda-env"
-        dirs = [env_prefix]
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", dirs=dirs, filespecs=filespecs):
+        with ctx.project("dummy_package", dirs=DIRS, filespecs=ctx.FILESPECS):
             x = env.CondaEnvironment(
                 req_scheme,
                 pip_args=pip_args,
                 basename=basename,
                 env_name=env_name,
-                env_prefix=env_prefix,
+                env_prefix=ENV_PREFIX,
                 dry_run=dry_run,
                 force=True,
             )
@@ -531,21 +449,18 @@ class TestEnv_320_CondaRemove(unittest.TestCase):
                 pip_args=pip_args,
                 basename=basename,
                 env_name=env_name,
-                env_prefix=env_prefix,
+                env_prefix=ENV_PREFIX,
                 dry_run=False,
                 force=True,
             )
             if not flags.should_suppress_output():
-                x.remove()  # remove non-existent
                 y.create()
                 x.remove()  # remove existing
             else:
                 original_stderrs = []
-                with ctx.capture_to_file(x.remove) as (_status, _stdout, stderr):
-                    original_stderrs.append(stderr)
                 with ctx.capture_to_file(y.create) as (_status, _stdout, stderr):
                     original_stderrs.append(stderr)
-                with ctx.capture_to_file(x.remove) as (_status, _stdout, stderr):
+                with ctx.capture_env(x, x.remove) as (_status, _stdout, stderr):
                     original_stderrs.append(stderr)
                 testable_stderrs = [text.lower() for text in original_stderrs]
                 for i, text in enumerate(testable_stderrs):
@@ -565,55 +480,17 @@ class TestEnv_330_CondaReplace(unittest.TestCase):
     def tearDown(self):
         pass
 
-    @parameterized.parameterized.expand(
-        [
-            ("plain_dry_run", reqs.REQ_SCHEME_PLAIN, True, None, None, []),
-            ("plain", reqs.REQ_SCHEME_PLAIN, False, None, None, []),
-            (
-                "plain_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                "dummy-env",
-                [],
-            ),
-            ("plain_env_name", reqs.REQ_SCHEME_PLAIN, False, None, "dummy-env", []),
-            ("dev_dry_run", reqs.REQ_SCHEME_DEV, True, None, None, []),
-            ("dev", reqs.REQ_SCHEME_DEV, False, None, None, []),
-            ("devplus_dry_run", reqs.REQ_SCHEME_DEVPLUS, True, None, None, []),
-            ("devplus", reqs.REQ_SCHEME_DEVPLUS, False, None, None, []),
-            ("frozen_dry_run", reqs.REQ_SCHEME_FROZEN, True, None, None, []),
-            ("frozen", reqs.REQ_SCHEME_FROZEN, False, None, None, []),
-            ("source_dry_run", reqs.REQ_SCHEME_SOURCE, True, None, None, []),
-            ("source", reqs.REQ_SCHEME_SOURCE, False, None, None, []),
-            ("wheel_dry_run", reqs.REQ_SCHEME_WHEEL, True, None, None, []),
-            ("wheel", reqs.REQ_SCHEME_WHEEL, False, None, None, []),
-            ("package_dry_run", reqs.REQ_SCHEME_PACKAGE, True, "argcomplete", None, []),
-            ("package", reqs.REQ_SCHEME_PACKAGE, False, "argcomplete", None, []),
-            ("pip_dry_run", reqs.REQ_SCHEME_PIP, True, None, None, ["argcomplete"]),
-            ("pip", reqs.REQ_SCHEME_PIP, False, None, None, ["argcomplete"]),
-        ]
-    )
+    @parameterized.parameterized.expand(ctx.SCHEME_MATRIX)
     def test_PV_ENV_CDA_310_replace_nonexistent(
         self, name, req_scheme, dry_run, basename, env_name, pip_args
     ):
-        env_prefix = ".conda-env"
-        dirs = [env_prefix]
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", dirs=dirs, filespecs=filespecs):
+        with ctx.project("dummy_package", dirs=DIRS, filespecs=ctx.FILESPECS):
             x = env.CondaEnvironment(
                 req_scheme,
                 pip_args=pip_args,
                 basename=basename,
                 env_name=env_name,
-                env_prefix=env_prefix,
+                env_prefix=ENV_PREFIX,
                 dry_run=dry_run,
                 force=True,
             )
@@ -621,7 +498,7 @@ class TestEnv_330_CondaReplace(unittest.TestCase):
                 x.replace()
             else:
                 original_stderrs = []
-                with ctx.capture_to_file(x.replace) as (_status, _stdout, stderr):
+                with ctx.capture_env(x, x.replace) as (_status, _stdout, stderr):
                     original_stderrs.append(stderr)
                 testable_stderrs = [text.lower() for text in original_stderrs]
                 for i, text in enumerate(testable_stderrs):
@@ -629,55 +506,17 @@ class TestEnv_330_CondaReplace(unittest.TestCase):
                         print(original_stderrs[i], file=stderr)
                     self.assertNotIn("error", text)
 
-    @parameterized.parameterized.expand(
-        [
-            ("plain_dry_run", reqs.REQ_SCHEME_PLAIN, True, None, None, []),
-            ("plain", reqs.REQ_SCHEME_PLAIN, False, None, None, []),
-            (
-                "plain_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                "dummy-env",
-                [],
-            ),
-            ("plain_env_name", reqs.REQ_SCHEME_PLAIN, False, None, "dummy-env", []),
-            ("dev_dry_run", reqs.REQ_SCHEME_DEV, True, None, None, []),
-            ("dev", reqs.REQ_SCHEME_DEV, False, None, None, []),
-            ("devplus_dry_run", reqs.REQ_SCHEME_DEVPLUS, True, None, None, []),
-            ("devplus", reqs.REQ_SCHEME_DEVPLUS, False, None, None, []),
-            ("frozen_dry_run", reqs.REQ_SCHEME_FROZEN, True, None, None, []),
-            ("frozen", reqs.REQ_SCHEME_FROZEN, False, None, None, []),
-            ("source_dry_run", reqs.REQ_SCHEME_SOURCE, True, None, None, []),
-            ("source", reqs.REQ_SCHEME_SOURCE, False, None, None, []),
-            ("wheel_dry_run", reqs.REQ_SCHEME_WHEEL, True, None, None, []),
-            ("wheel", reqs.REQ_SCHEME_WHEEL, False, None, None, []),
-            ("package_dry_run", reqs.REQ_SCHEME_PACKAGE, True, "argcomplete", None, []),
-            ("package", reqs.REQ_SCHEME_PACKAGE, False, "argcomplete", None, []),
-            ("pip_dry_run", reqs.REQ_SCHEME_PIP, True, None, None, ["argcomplete"]),
-            ("pip", reqs.REQ_SCHEME_PIP, False, None, None, ["argcomplete"]),
-        ]
-    )
+    @parameterized.parameterized.expand(ctx.SCHEME_MATRIX)
     def test_PV_ENV_CDA_320_replace_existing(
         self, name, req_scheme, dry_run, basename, env_name, pip_args
     ):
-        env_prefix = ".conda-env"
-        dirs = [env_prefix]
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", dirs=dirs, filespecs=filespecs):
+        with ctx.project("dummy_package", dirs=DIRS, filespecs=ctx.FILESPECS):
             x = env.CondaEnvironment(
                 req_scheme,
                 pip_args=pip_args,
                 basename=basename,
                 env_name=env_name,
-                env_prefix=env_prefix,
+                env_prefix=ENV_PREFIX,
                 dry_run=dry_run,
                 force=True,
             )
@@ -686,7 +525,7 @@ class TestEnv_330_CondaReplace(unittest.TestCase):
                 pip_args=pip_args,
                 basename=basename,
                 env_name=env_name,
-                env_prefix=env_prefix,
+                env_prefix=ENV_PREFIX,
                 dry_run=False,
                 force=True,
             )
@@ -697,10 +536,64 @@ class TestEnv_330_CondaReplace(unittest.TestCase):
                 original_stderrs = []
                 with ctx.capture_to_file(y.create) as (_status, _stdout, stderr):
                     original_stderrs.append(stderr)
-                with ctx.capture_to_file(x.replace) as (_status, _stdout, stderr):
+                with ctx.capture_env(x, x.replace) as (_status, _stdout, stderr):
                     original_stderrs.append(stderr)
                 testable_stderrs = [text.lower() for text in original_stderrs]
                 for i, text in enumerate(testable_stderrs):
                     if "error" in text:
                         print(original_stderrs[i], file=stderr)
                     self.assertNotIn("error", text)
+
+
+########################################
+
+
+class TestEnv_340_CondaCreateCommands(unittest.TestCase):
+    @parameterized.parameterized.expand(
+        [
+            ("plain", reqs.REQ_SCHEME_PLAIN, "dummy-package", "requirements.txt"),
+            ("dev", reqs.REQ_SCHEME_DEV, "dummy-package-dev", "requirements_dev.txt"),
+            (
+                "frozen",
+                reqs.REQ_SCHEME_FROZEN,
+                "dummy-package",
+                "requirements_frozen.txt",
+            ),
+        ]
+    )
+    def test_PV_ENV_CDA_400_create_commands(
+        self, name, req_scheme, env_name, requirements_file
+    ):
+        with ctx.project("dummy_package", dirs=DIRS, filespecs=ctx.FILESPECS):
+            x = env.CondaEnvironment(
+                req_scheme,
+                basename="dummy-package",
+                env_prefix=ENV_PREFIX,
+                force=True,
+            )
+            with patch.object(subprocess, "check_call", return_value=0) as check_call:
+                with ctx.capture(x.create) as (_status, _stdout, stderr):
+                    self.assertNotIn("error", stderr.lower())
+            env_dir = os.path.join(ENV_PREFIX, env_name)
+            self.assertListEqual(
+                [args[0] for (args, _kwargs) in check_call.call_args_list],
+                [
+                    [
+                        "conda",
+                        "create",
+                        "--quiet",
+                        "--yes",
+                        "-p",
+                        os.path.abspath(env_dir),
+                        "python=3",
+                    ],
+                    [
+                        os.path.join(env_dir, "bin", "python3"),
+                        "-m",
+                        "pip",
+                        "install",
+                        "-r",
+                        requirements_file,
+                    ],
+                ],
+            )
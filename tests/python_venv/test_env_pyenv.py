@@ -1,29 +1,46 @@
 """Provide unit tests for `~python_venv.env.pyenv`:py:mod:."""
 
+import contextlib
+import functools
 import os
 import os.path
 import random
+import string
 import subprocess
 import unittest
+from unittest.mock import patch
 
 import parameterized  # https://pypi.org/project/parameterized/
 
-from python_venv import const, env
+from python_venv import env
 from python_venv import exceptions as exc
 from python_venv import reqs
 from tests.python_venv import contextmgr as ctx
 from tests.python_venv import flags
 
+ENV_PREFIX_CHARS = string.digits + string.ascii_uppercase + string.ascii_lowercase
+
+########################################
+
+
+_dry_run_stderr = functools.partial(
+    ctx.dry_run_stderr, env.PyenvEnvironment, basename="dummy-package"
+)
+
+
 ########################################
 
 
 @unittest.skipUnless(flags.should_run_pyenv_tests(), flags.SKIP_PYENV_MESSAGE)
 class TestEnv_200_PyenvEnvironment(unittest.TestCase):
-    def setUp(self):
-        self.saved_requirements = reqs.REQUIREMENTS
+    @classmethod
+    def setUpClass(cls):
+        # Shared by this class's tests, which only read attributes.
+        cls._environment = staticmethod(ctx.environment_cache(env.PyenvEnvironment))
 
-    def tearDown(self):
-        reqs.REQUIREMENTS = self.saved_requirements
+    @classmethod
+    def tearDownClass(cls):
+        del cls._environment
 
     def test_PV_ENV_PYNV_000_instantiate_empty(self):
         with self.assertRaises(TypeError) as raised:
@@ -58,9 +75,11 @@ class TestEnv_200_PyenvEnvironment(unittest.TestCase):
 
     def test_PV_ENV_PYNV_010_requirements(self):
         dummy_requirements = {"dummy_req_source": ["dummy_requirement"]}
-        reqs.REQUIREMENTS = {"dummy_req_scheme": [dummy_requirements]}
-        x = env.PyenvEnvironment("dummy_req_scheme")
-        self.assertListEqual(x.requirements.requirements, [dummy_requirements])
+        with patch.object(
+            reqs, "REQUIREMENTS", {"dummy_req_scheme": [dummy_requirements]}
+        ):
+            x = env.PyenvEnvironment("dummy_req_scheme")
+            self.assertListEqual(x.requirements.requirements, [dummy_requirements])
 
     def test_PV_ENV_PYNV_020_package_name(self):
         x = env.PyenvEnvironment("dummy_req_scheme")
@@ -74,7 +93,7 @@ class TestEnv_200_PyenvEnvironment(unittest.TestCase):
     )
     def test_PV_ENV_PYNV_030_basename(self, name, basename, expected):
         kwargs = {} if basename is None else {"basename": basename}
-        x = env.PyenvEnvironment("dummy_req_scheme", **kwargs)
+        x = self._environment("dummy_req_scheme", **kwargs)
         self.assertEqual(x.basename, expected)
 
     @parameterized.parameterized.expand(
@@ -122,7 +141,7 @@ class TestEnv_200_PyenvEnvironment(unittest.TestCase):
         ]
     )
     def test_PV_ENV_PYNV_040_env_name(self, name, req_scheme, kwargs, expected):
-        x = env.PyenvEnvironment(req_scheme, **kwargs)
+        x = self._environment(req_scheme, **kwargs)
         self.assertEqual(x.env_name, expected)
 
     @parameterized.parameterized.expand(
@@ -149,7 +168,7 @@ class TestEnv_200_PyenvEnvironment(unittest.TestCase):
             kwargs["env_name"] = env_name
         if env_prefix is not None:
             kwargs["env_prefix"] = env_prefix
-        x = env.PyenvEnvironment(reqs.REQ_SCHEME_PLAIN, dry_run=True, **kwargs)
+        x = self._environment(reqs.REQ_SCHEME_PLAIN, dry_run=True, **kwargs)
         self.assertEqual(x.env_dir, expected)
 
     @parameterized.parameterized.expand(
@@ -159,28 +178,28 @@ class TestEnv_200_PyenvEnvironment(unittest.TestCase):
                 "dummy-basename",
                 None,
                 None,
-                os.path.join(os.getcwd(), "<ENV_DIR>"),
+                "<ENV_DIR>",
             ),
             (
                 "specified",
                 None,
                 "dummy-env",
                 None,
-                os.path.join(os.getcwd(), "<ENV_DIR>"),
+                "<ENV_DIR>",
             ),
             (
                 "with_prefix",
                 "dummy-basename",
                 None,
                 "dummy-prefix",
-                os.path.join(os.getcwd(), "<ENV_DIR>"),
+                "<ENV_DIR>",
             ),
             (
                 "specified_with_prefix",
                 "dummy-basename",
                 "dummy-env",
                 "dummy-prefix",
-                os.path.join(os.getcwd(), "<ENV_DIR>"),
+                "<ENV_DIR>",
             ),
         ]
     )
@@ -194,8 +213,9 @@ class TestEnv_200_PyenvEnvironment(unittest.TestCase):
             kwargs["env_name"] = env_name
         if env_prefix is not None:
             kwargs["env_prefix"] = env_prefix
-        x = env.PyenvEnvironment(reqs.REQ_SCHEME_PLAIN, dry_run=True, **kwargs)
-        self.assertEqual(x.abs_env_dir, expected)
+        x = self._environment(reqs.REQ_SCHEME_PLAIN, dry_run=True, **kwargs)
+        # resolved against the current directory
+        self.assertEqual(x.abs_env_dir, os.path.join(os.getcwd(), expected))
 
     @parameterized.parameterized.expand(
         [
@@ -204,40 +224,25 @@ class TestEnv_200_PyenvEnvironment(unittest.TestCase):
     )
     def test_PV_ENV_PYNV_060_env_description(self, name, env_name, expected):
         kwargs = {} if env_name is None else {"env_name": env_name}
-        x = env.PyenvEnvironment("dummy_req_scheme", **kwargs)
+        x = self._environment("dummy_req_scheme", **kwargs)
         x.env_description
         self.assertTrue(x.env_description.endswith(expected))
 
     @parameterized.parameterized.expand(
         [
-            ("dry_run_text", {}, "[DRY-RUN]"),
-            ("create_msg", {}, "Creating pyenv environment dummy-package"),
-            ("create_venv", {}, "+ pyenv virtualenv"),
-            ("install_msg", {}, "Installing dummy_req_scheme requirements"),
+            ("dry_run_text", "[DRY-RUN]"),
+            ("create_msg", "Creating pyenv environment dummy-package"),
+            ("create_venv", "+ pyenv virtualenv"),
+            ("install_msg", "Installing dummy_req_scheme requirements"),
             (
                 "pip_install",
-                {},
                 "+ <ENV_DIR>/bin/python3 -m pip install -r dummy_requirements.txt",
             ),
-            ("success", {}, "==> Done."),
+            ("success", "==> Done."),
         ]
     )
-    def test_PV_ENV_PYNV_100_create_dry_run(self, name, kwargs, expected_text):
-        dummy_requirements = {const.FROM_FILES: ["dummy_requirements.txt"]}
-        reqs.REQUIREMENTS = {"dummy_req_scheme": [dummy_requirements]}
-        x = env.PyenvEnvironment(
-            "dummy_req_scheme",
-            dry_run=True,
-            basename="dummy-package",
-            ignore_preflight_checks=True,
-            **kwargs,
-        )
-        with ctx.capture(x.create) as (
-            status,
-            _stdout,
-            stderr,
-        ):
-            self.assertTrue(expected_text in stderr)
+    def test_PV_ENV_PYNV_100_create_dry_run(self, name, expected_text):
+        self.assertIn(expected_text, _dry_run_stderr("create"))
 
     @parameterized.parameterized.expand(
         [
@@ -246,11 +251,7 @@ class TestEnv_200_PyenvEnvironment(unittest.TestCase):
         ]
     )
     def test_PV_ENV_PYNV_200_remove_dry_run(self, name, expected_text):
-        x = env.PyenvEnvironment(
-            reqs.REQ_SCHEME_PLAIN, dry_run=True, basename="dummy-package"
-        )
-        with ctx.capture(x.remove) as (status, _stdout, stderr):
-            self.assertTrue(expected_text in stderr)
+        self.assertIn(expected_text, _dry_run_stderr("remove"))
 
     @parameterized.parameterized.expand(
         [
@@ -262,37 +263,37 @@ class TestEnv_200_PyenvEnvironment(unittest.TestCase):
         ]
     )
     def test_PV_ENV_PYNV_300_replace_dry_run(self, name, expected_text):
-        dummy_requirements = {const.FROM_FILES: ["dummy_requirements.txt"]}
-        reqs.REQUIREMENTS = {"dummy_req_scheme": [dummy_requirements]}
-        x = env.PyenvEnvironment(
-            "dummy_req_scheme",
-            dry_run=True,
-            basename="dummy-package",
-            ignore_preflight_checks=True,
-        )
-        with ctx.capture(x.replace) as (status, _stdout, stderr):
-            self.assertTrue(expected_text in stderr)
+        self.assertIn(expected_text, _dry_run_stderr("replace"))
 
 
 ########################################
 
 
-@unittest.skipUnless(flags.should_run_pyenv_tests(), flags.SKIP_PYENV_MESSAGE)
-class TestEnv_210_PyenvCreate(unittest.TestCase):
-    def setUp(self):
-        self.env_name = None
+class _PyenvEnvTestCase(unittest.TestCase):
+    """Set up and clean up after the pyenv create/remove/replace tests."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.suppress_output = flags.should_suppress_output()
+        cls.stack = contextlib.ExitStack()
         try:
-            self.choices
-        except AttributeError:
-            self.choices = (
-                [chr(x) for x in range(ord("0"), ord("9") + 1)]
-                + [chr(x) for x in range(ord("A"), ord("Z") + 1)]
-                + [chr(x) for x in range(ord("a"), ord("z") + 1)]
+            cls.stack.enter_context(
+                ctx.project("dummy_package", filespecs=ctx.FILESPECS)
             )
+        except BaseException:
+            cls.stack.close()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.stack.close()
+
+    def setUp(self):
+        self.env_name = None
         # Random prefix for environments is required
         # since pyenv virtualenv doesn't give us a choice
         # to place an environment somewhere specific.
-        self.env_prefix = "".join(random.choice(self.choices) for x in range(10)) + "-"
+        self.env_prefix = "".join(random.choices(ENV_PREFIX_CHARS, k=10)) + "-"
 
     def tearDown(self):
         if self.env_name is not None:
@@ -303,75 +304,34 @@ class TestEnv_210_PyenvCreate(unittest.TestCase):
             )
             self.env_name = None
 
-    @parameterized.parameterized.expand(
-        [
-            ("plain_dry_run", reqs.REQ_SCHEME_PLAIN, True, None, None, []),
-            ("plain", reqs.REQ_SCHEME_PLAIN, False, None, None, []),
-            (
-                "plain_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                "dummy-env",
-                [],
-            ),
-            ("plain_env_name", reqs.REQ_SCHEME_PLAIN, False, None, "dummy-env", []),
-            ("dev_dry_run", reqs.REQ_SCHEME_DEV, True, None, None, []),
-            ("dev", reqs.REQ_SCHEME_DEV, False, None, None, []),
-            ("devplus_dry_run", reqs.REQ_SCHEME_DEVPLUS, True, None, None, []),
-            ("devplus", reqs.REQ_SCHEME_DEVPLUS, False, None, None, []),
-            ("frozen_dry_run", reqs.REQ_SCHEME_FROZEN, True, None, None, []),
-            ("frozen", reqs.REQ_SCHEME_FROZEN, False, None, None, []),
-            ("source_dry_run", reqs.REQ_SCHEME_SOURCE, True, None, None, []),
-            ("source", reqs.REQ_SCHEME_SOURCE, False, None, None, []),
-            ("wheel_dry_run", reqs.REQ_SCHEME_WHEEL, True, None, None, []),
-            ("wheel", reqs.REQ_SCHEME_WHEEL, False, None, None, []),
-            ("package_dry_run", reqs.REQ_SCHEME_PACKAGE, True, "argcomplete", None, []),
-            ("package", reqs.REQ_SCHEME_PACKAGE, False, "argcomplete", None, []),
-            ("pip_dry_run", reqs.REQ_SCHEME_PIP, True, None, None, ["argcomplete"]),
-            ("pip", reqs.REQ_SCHEME_PIP, False, None, None, ["argcomplete"]),
-        ]
-    )
+
+########################################
+
+
+@unittest.skipUnless(flags.should_run_pyenv_tests(), flags.SKIP_PYENV_MESSAGE)
+class TestEnv_210_PyenvCreate(_PyenvEnvTestCase):
+    @parameterized.parameterized.expand(ctx.SCHEME_MATRIX)
     def test_PV_ENV_PYNV_110_create(
         self, name, req_scheme, dry_run, basename, env_name, pip_args
     ):
         env_prefix = self.env_prefix
         if env_name:
             env_name = env_prefix + env_name
-        dirs = []
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", dirs=dirs, filespecs=filespecs):
-            x = env.PyenvEnvironment(
-                req_scheme,
-                pip_args=pip_args,
-                basename=basename,
-                env_name=env_name,
-                env_prefix=env_prefix,
-                dry_run=dry_run,
-                force=True,
-            )
-            self.env_name = x.env_name
-            if not flags.should_suppress_output():
+        x = env.PyenvEnvironment(
+            req_scheme,
+            pip_args=pip_args,
+            basename=basename,
+            env_name=env_name,
+            env_prefix=env_prefix,
+            dry_run=dry_run,
+            force=True,
+        )
+        with ctx.fake_pyenv_subprocesses():
+            if not self.suppress_output:
                 x.create()
             else:
-                original_stderr = None
-                with ctx.capture_to_file(x.create) as (
-                    _status,
-                    _stdout,
-                    stderr,
-                ):
-                    original_stderr = stderr
-                testable_stderr = original_stderr.lower()
-                if "error" in testable_stderr:
-                    print(original_stderr, file=stderr)
-                self.assertNotIn("error", testable_stderr)
+                with ctx.capture_env(x, x.create) as (_status, _stdout, stderr):
+                    self.assertNotRegex(stderr, ctx.ERROR_PATTERN)
 
     @parameterized.parameterized.expand(
         [
@@ -401,17 +361,17 @@ class TestEnv_210_PyenvCreate(unittest.TestCase):
                 dry_run=dry_run,
                 force=True,
             )
-            self.env_name = x.env_name
-            with self.assertRaises(exc.MissingRequirementsError):
-                if not flags.should_suppress_output():
-                    x.create()
-                else:
-                    with ctx.capture_to_file(x.create) as (
-                        _status,
-                        _stdout,
-                        _stderr,
-                    ):
-                        pass
+            with ctx.fake_pyenv_subprocesses():
+                with self.assertRaises(exc.MissingRequirementsError):
+                    if not self.suppress_output:
+                        x.create()
+                    else:
+                        with ctx.capture_env(x, x.create) as (
+                            _status,
+                            _stdout,
+                            _stderr,
+                        ):
+                            pass
 
     @parameterized.parameterized.expand(
         [
@@ -433,343 +393,143 @@ class TestEnv_210_PyenvCreate(unittest.TestCase):
         env_prefix = self.env_prefix
         if env_name:
             env_name = env_prefix + env_name
-        dirs = []
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", dirs=dirs, filespecs=filespecs):
-            x = env.PyenvEnvironment(
-                req_scheme,
-                env_name=env_name,
-                env_prefix=env_prefix,
-                dry_run=False,
-                force=True,
-            )
-            self.env_name = x.env_name
-            if not flags.should_suppress_output():
-                x.create()
-            else:
-                with ctx.capture_to_file(x.create) as (_status, _stdout, _stderr):
-                    pass
-            x = env.PyenvEnvironment(
-                req_scheme,
-                env_name=env_name,
-                env_prefix=env_prefix,
-                dry_run=dry_run,
-                force=True,
-            )
+        x = env.PyenvEnvironment(
+            req_scheme,
+            env_name=env_name,
+            env_prefix=env_prefix,
+            dry_run=dry_run,
+            force=True,
+        )
+        with ctx.fake_pyenv_subprocesses() as versions_dir:
+            os.makedirs(os.path.join(versions_dir, x.env_name))  # the duplicate
             if should_raise:
                 with self.assertRaises(exc.EnvExistsError):
-                    if not flags.should_suppress_output():
+                    if not self.suppress_output:
                         x.create()
                     else:
-                        with ctx.capture_to_file(x.create) as (
+                        with ctx.capture_env(x, x.create) as (
                             _status,
                             _stdout,
                             _stderr,
                         ):
                             pass
             else:
-                if not flags.should_suppress_output():
+                if not self.suppress_output:
                     x.create()
                 else:
-                    original_stderr = None
-                    with ctx.capture_to_file(x.create) as (_status, _stdout, stderr):
-                        original_stderr = stderr
-                    testable_stderr = original_stderr.lower()
-                    if "error" in testable_stderr:
-                        print(original_stderr, file=stderr)
-                    self.assertNotIn("error", testable_stderr)
+                    with ctx.capture_env(x, x.create) as (_status, _stdout, stderr):
+                        self.assertNotRegex(stderr, ctx.ERROR_PATTERN)
 
 
 ########################################
 
 
 @unittest.skipUnless(flags.should_run_pyenv_tests(), flags.SKIP_PYENV_MESSAGE)
-class TestEnv_220_PyenvRemove(unittest.TestCase):
-    def setUp(self):
-        self.env_name = None
-        try:
-            self.choices
-        except AttributeError:
-            self.choices = (
-                [chr(x) for x in range(ord("0"), ord("9") + 1)]
-                + [chr(x) for x in range(ord("A"), ord("Z") + 1)]
-                + [chr(x) for x in range(ord("a"), ord("z") + 1)]
-            )
-        # Random prefix for environments is required
-        # since pyenv virtualenv doesn't give us a choice
-        # to place an environment somewhere specific.
-        self.env_prefix = "".join(random.choice(self.choices) for x in range(10)) + "-"
-
-    def tearDown(self):
-        if self.env_name is not None:
-            # remove pyenv virtual environment
-            subprocess.call(
-                ["pyenv", "virtualenv-delete", "-f", self.env_name],
-                stderr=subprocess.DEVNULL,
-            )
-            self.env_name = None
-
-    @parameterized.parameterized.expand(
-        [
-            ("plain_dry_run", reqs.REQ_SCHEME_PLAIN, True, None, None, []),
-            ("plain", reqs.REQ_SCHEME_PLAIN, False, None, None, []),
-            (
-                "plain_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                "dummy-env",
-                [],
-            ),
-            ("plain_env_name", reqs.REQ_SCHEME_PLAIN, False, None, "dummy-env", []),
-            ("dev_dry_run", reqs.REQ_SCHEME_DEV, True, None, None, []),
-            ("dev", reqs.REQ_SCHEME_DEV, False, None, None, []),
-            ("devplus_dry_run", reqs.REQ_SCHEME_DEVPLUS, True, None, None, []),
-            ("devplus", reqs.REQ_SCHEME_DEVPLUS, False, None, None, []),
-            ("frozen_dry_run", reqs.REQ_SCHEME_FROZEN, True, None, None, []),
-            ("frozen", reqs.REQ_SCHEME_FROZEN, False, None, None, []),
-            ("source_dry_run", reqs.REQ_SCHEME_SOURCE, True, None, None, []),
-            ("source", reqs.REQ_SCHEME_SOURCE, False, None, None, []),
-            ("wheel_dry_run", reqs.REQ_SCHEME_WHEEL, True, None, None, []),
-            ("wheel", reqs.REQ_SCHEME_WHEEL, False, None, None, []),
-            ("package_dry_run", reqs.REQ_SCHEME_PACKAGE, True, "argcomplete", None, []),
-            ("package", reqs.REQ_SCHEME_PACKAGE, False, "argcomplete", None, []),
-            ("pip_dry_run", reqs.REQ_SCHEME_PIP, True, None, None, ["argcomplete"]),
-            ("pip", reqs.REQ_SCHEME_PIP, False, None, None, ["argcomplete"]),
-        ]
-    )
+class TestEnv_220_PyenvRemove(_PyenvEnvTestCase):
+    @parameterized.parameterized.expand(ctx.SCHEME_MATRIX)
     def test_PV_ENV_PYNV_210_remove(
         self, name, req_scheme, dry_run, basename, env_name, pip_args
     ):
         env_prefix = self.env_prefix
         if env_name:
             env_name = env_prefix + env_name
-        dirs = []
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", dirs=dirs, filespecs=filespecs):
-            x = env.PyenvEnvironment(
-                req_scheme,
-                pip_args=pip_args,
-                basename=basename,
-                env_name=env_name,
-                env_prefix=env_prefix,
-                dry_run=dry_run,
-                force=True,
-            )
-            y = env.PyenvEnvironment(
-                req_scheme,
-                pip_args=pip_args,
-                basename=basename,
-                env_name=env_name,
-                env_prefix=env_prefix,
-                dry_run=False,
-                force=True,
-            )
-            self.env_name = y.env_name
-            if not flags.should_suppress_output():
+        x = env.PyenvEnvironment(
+            req_scheme,
+            pip_args=pip_args,
+            basename=basename,
+            env_name=env_name,
+            env_prefix=env_prefix,
+            dry_run=dry_run,
+            force=True,
+        )
+        y = env.PyenvEnvironment(
+            req_scheme,
+            pip_args=pip_args,
+            basename=basename,
+            env_name=env_name,
+            env_prefix=env_prefix,
+            dry_run=False,
+            force=True,
+        )
+        with ctx.fake_pyenv_subprocesses():
+            if not self.suppress_output:
                 x.remove()  # remove non-existent
                 y.create()
                 x.remove()  # remove existing
             else:
                 original_stderrs = []
-                with ctx.capture_to_file(x.remove) as (_status, _stdout, stderr):
+                with ctx.capture_env(x, x.remove) as (_status, _stdout, stderr):
                     original_stderrs.append(stderr)
-                with ctx.capture_to_file(y.create) as (_status, _stdout, stderr):
+                with ctx.capture_env(y, y.create) as (_status, _stdout, stderr):
                     original_stderrs.append(stderr)
-                with ctx.capture_to_file(x.remove) as (_status, _stdout, stderr):
+                with ctx.capture_env(x, x.remove) as (_status, _stdout, stderr):
                     original_stderrs.append(stderr)
-                testable_stderrs = [text.lower() for text in original_stderrs]
-                for i, text in enumerate(testable_stderrs):
-                    if "error" in text:
-                        print(original_stderrs[i], file=stderr)
-                    self.assertNotIn("error", text)
+                for text in original_stderrs:
+                    self.assertNotRegex(text, ctx.ERROR_PATTERN)
+
+    @unittest.skipUnless(flags.should_run_long_tests(), flags.SKIP_LONG_RUNNING_MESSAGE)
+    def test_PV_ENV_PYNV_290_create_and_remove_for_real(self):
+        x = env.PyenvEnvironment(
+            reqs.REQ_SCHEME_PLAIN, env_prefix=self.env_prefix, force=True
+        )
+        self.env_name = x.env_name
+        for a_callable in (x.create, x.remove):
+            if not self.suppress_output:
+                a_callable()
+            else:
+                with ctx.capture_to_file(a_callable) as (_status, _stdout, stderr):
+                    self.assertNotRegex(stderr, ctx.ERROR_PATTERN)
+        self.assertFalse(x.env_exists())
 
 
 ########################################
 
 
 @unittest.skipUnless(flags.should_run_pyenv_tests(), flags.SKIP_PYENV_MESSAGE)
-class TestEnv_230_PyenvReplace(unittest.TestCase):
-    def setUp(self):
-        self.env_name = None
-        try:
-            self.choices
-        except AttributeError:
-            self.choices = (
-                [chr(x) for x in range(ord("0"), ord("9") + 1)]
-                + [chr(x) for x in range(ord("A"), ord("Z") + 1)]
-                + [chr(x) for x in range(ord("a"), ord("z") + 1)]
-            )
-        # Random prefix for environments is required
-        # since pyenv virtualenv doesn't give us a choice
-        # to place an environment somewhere specific.
-        self.env_prefix = "".join(random.choice(self.choices) for x in range(10)) + "-"
-
-    def tearDown(self):
-        if self.env_name is not None:
-            # remove pyenv virtual environment
-            subprocess.call(
-                ["pyenv", "virtualenv-delete", "-f", self.env_name],
-                stderr=subprocess.DEVNULL,
-            )
-            self.env_name = None
-
-    @parameterized.parameterized.expand(
-        [
-            ("plain_dry_run", reqs.REQ_SCHEME_PLAIN, True, None, None, []),
-            ("plain", reqs.REQ_SCHEME_PLAIN, False, None, None, []),
-            (
-                "plain_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                "dummy-env",
-                [],
-            ),
-            ("plain_env_name", reqs.REQ_SCHEME_PLAIN, False, None, "dummy-env", []),
-            ("dev_dry_run", reqs.REQ_SCHEME_DEV, True, None, None, []),
-            ("dev", reqs.REQ_SCHEME_DEV, False, None, None, []),
-            ("devplus_dry_run", reqs.REQ_SCHEME_DEVPLUS, True, None, None, []),
-            ("devplus", reqs.REQ_SCHEME_DEVPLUS, False, None, None, []),
-            ("frozen_dry_run", reqs.REQ_SCHEME_FROZEN, True, None, None, []),
-            ("frozen", reqs.REQ_SCHEME_FROZEN, False, None, None, []),
-            ("source_dry_run", reqs.REQ_SCHEME_SOURCE, True, None, None, []),
-            ("source", reqs.REQ_SCHEME_SOURCE, False, None, None, []),
-            ("wheel_dry_run", reqs.REQ_SCHEME_WHEEL, True, None, None, []),
-            ("wheel", reqs.REQ_SCHEME_WHEEL, False, None, None, []),
-            ("package_dry_run", reqs.REQ_SCHEME_PACKAGE, True, "argcomplete", None, []),
-            ("package", reqs.REQ_SCHEME_PACKAGE, False, "argcomplete", None, []),
-            ("pip_dry_run", reqs.REQ_SCHEME_PIP, True, None, None, ["argcomplete"]),
-            ("pip", reqs.REQ_SCHEME_PIP, False, None, None, ["argcomplete"]),
-        ]
-    )
+class TestEnv_230_PyenvReplace(_PyenvEnvTestCase):
+    @parameterized.parameterized.expand(ctx.SCHEME_MATRIX)
     def test_PV_ENV_PYNV_310_replace_nonexistent(
         self, name, req_scheme, dry_run, basename, env_name, pip_args
     ):
         env_prefix = self.env_prefix
         if env_name:
             env_name = env_prefix + env_name
-        dirs = []
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", dirs=dirs, filespecs=filespecs):
-            x = env.PyenvEnvironment(
-                req_scheme,
-                pip_args=pip_args,
-                basename=basename,
-                env_name=env_name,
-                env_prefix=env_prefix,
-                dry_run=dry_run,
-                force=True,
-            )
-            self.env_name = x.env_name
-            if not flags.should_suppress_output():
+        x = env.PyenvEnvironment(
+            req_scheme,
+            pip_args=pip_args,
+            basename=basename,
+            env_name=env_name,
+            env_prefix=env_prefix,
+            dry_run=dry_run,
+            force=True,
+        )
+        with ctx.fake_pyenv_subprocesses():
+            if not self.suppress_output:
                 x.replace()
             else:
-                original_stderrs = []
-                with ctx.capture_to_file(x.replace) as (_status, _stdout, stderr):
-                    original_stderrs.append(stderr)
-                testable_stderrs = [text.lower() for text in original_stderrs]
-                for i, text in enumerate(testable_stderrs):
-                    if "error" in text:
-                        print(original_stderrs[i], file=stderr)
-                    self.assertNotIn("error", text)
+                with ctx.capture_env(x, x.replace) as (_status, _stdout, stderr):
+                    self.assertNotRegex(stderr, ctx.ERROR_PATTERN)
 
-    @parameterized.parameterized.expand(
-        [
-            ("plain_dry_run", reqs.REQ_SCHEME_PLAIN, True, None, None, []),
-            ("plain", reqs.REQ_SCHEME_PLAIN, False, None, None, []),
-            (
-                "plain_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                "dummy-env",
-                [],
-            ),
-            ("plain_env_name", reqs.REQ_SCHEME_PLAIN, False, None, "dummy-env", []),
-            ("dev_dry_run", reqs.REQ_SCHEME_DEV, True, None, None, []),
-            ("dev", reqs.REQ_SCHEME_DEV, False, None, None, []),
-            ("devplus_dry_run", reqs.REQ_SCHEME_DEVPLUS, True, None, None, []),
-            ("devplus", reqs.REQ_SCHEME_DEVPLUS, False, None, None, []),
-            ("frozen_dry_run", reqs.REQ_SCHEME_FROZEN, True, None, None, []),
-            ("frozen", reqs.REQ_SCHEME_FROZEN, False, None, None, []),
-            ("source_dry_run", reqs.REQ_SCHEME_SOURCE, True, None, None, []),
-            ("source", reqs.REQ_SCHEME_SOURCE, False, None, None, []),
-            ("wheel_dry_run", reqs.REQ_SCHEME_WHEEL, True, None, None, []),
-            ("wheel", reqs.REQ_SCHEME_WHEEL, False, None, None, []),
-            ("package_dry_run", reqs.REQ_SCHEME_PACKAGE, True, "argcomplete", None, []),
-            ("package", reqs.REQ_SCHEME_PACKAGE, False, "argcomplete", None, []),
-            ("pip_dry_run", reqs.REQ_SCHEME_PIP, True, None, None, ["argcomplete"]),
-            ("pip", reqs.REQ_SCHEME_PIP, False, None, None, ["argcomplete"]),
-        ]
-    )
+    @parameterized.parameterized.expand(ctx.SCHEME_MATRIX)
     def test_PV_ENV_PYNV_320_replace_existing(
         self, name, req_scheme, dry_run, basename, env_name, pip_args
     ):
         env_prefix = self.env_prefix
         if env_name:
             env_name = env_prefix + env_name
-        dirs = []
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", dirs=dirs, filespecs=filespecs):
-            x = env.PyenvEnvironment(
-                req_scheme,
-                pip_args=pip_args,
-                basename=basename,
-                env_name=env_name,
-                env_prefix=env_prefix,
-                dry_run=dry_run,
-                force=True,
-            )
-            y = env.PyenvEnvironment(
-                req_scheme,
-                pip_args=pip_args,
-                basename=basename,
-                env_name=env_name,
-                env_prefix=env_prefix,
-                dry_run=False,
-                force=True,
-            )
-            self.env_name = y.env_name
-            if not flags.should_suppress_output():
-                y.create()
+        x = env.PyenvEnvironment(
+            req_scheme,
+            pip_args=pip_args,
+            basename=basename,
+            env_name=env_name,
+            env_prefix=env_prefix,
+            dry_run=dry_run,
+            force=True,
+        )
+        with ctx.fake_pyenv_subprocesses() as versions_dir:
+            os.makedirs(os.path.join(versions_dir, x.env_name))  # the existing env
+            if not self.suppress_output:
                 x.replace()
             else:
-                original_stderrs = []
-                with ctx.capture_to_file(y.create) as (_status, _stdout, stderr):
-                    original_stderrs.append(stderr)
-                with ctx.capture_to_file(x.replace) as (_status, _stdout, stderr):
-                    original_stderrs.append(stderr)
-                testable_stderrs = [text.lower() for text in original_stderrs]
-                for i, text in enumerate(testable_stderrs):
-                    if "error" in text:
-                        print(original_stderrs[i], file=stderr)
-                    self.assertNotIn("error", text)
+                with ctx.capture_env(x, x.replace) as (_status, _stdout, stderr):
+                    self.assertNotRegex(stderr, ctx.ERROR_PATTERN)
@@ -1,27 +1,96 @@
 """Provide unit tests for `~python_venv.env.venv`:py:mod:."""
 
+import contextlib
+import functools
 import os
 import os.path
+import shutil
 import subprocess
 import unittest
+from unittest.mock import patch
 
 import parameterized  # https://pypi.org/project/parameterized/
 
-from python_venv import const, env
+from python_venv import env
 from python_venv import exceptions as exc
 from python_venv import reqs
 from tests.python_venv import contextmgr as ctx
 from tests.python_venv import flags
 
+SCHEMES = (
+    ("plain", reqs.REQ_SCHEME_PLAIN, None, None, None, ()),
+    ("plain", reqs.REQ_SCHEME_PLAIN, None, ".dummy-venv", None, ()),
+    ("prefix", reqs.REQ_SCHEME_PLAIN, None, None, "dummy-prefix", ()),
+    ("prefix", reqs.REQ_SCHEME_PLAIN, None, ".dummy-venv", "dummy-prefix", ()),
+    ("dev", reqs.REQ_SCHEME_DEV, None, None, None, ()),
+    ("devplus", reqs.REQ_SCHEME_DEVPLUS, None, None, None, ()),
+    ("frozen", reqs.REQ_SCHEME_FROZEN, None, None, None, ()),
+    ("source", reqs.REQ_SCHEME_SOURCE, None, None, None, ()),
+    ("wheel", reqs.REQ_SCHEME_WHEEL, None, None, None, ()),
+    ("package", reqs.REQ_SCHEME_PACKAGE, "argcomplete", None, None, ()),
+    ("pip", reqs.REQ_SCHEME_PIP, None, None, None, ("argcomplete",)),
+)
+
+SCHEME_MATRIX = ctx.scheme_matrix(SCHEMES)
+
+# The create tests take no env_prefix, so drop the prefix rows and column.
+CREATE_MATRIX = tuple(row[:5] + row[6:] for row in SCHEME_MATRIX if row[5] is None)
+
+
+_dry_run_stderr = functools.partial(
+    ctx.dry_run_stderr, env.VenvEnvironment, env_name=".dummy-venv"
+)
+
+
+def _new_environment(req_scheme, dry_run, basename, env_name, env_prefix, pip_args):
+    """
+    Construct a `VenvEnvironment` from the columns of a `SCHEME_MATRIX` row.
+
+    Tests that need a real environment alongside a dry-run one call this
+    again with ``dry_run=False``.
+    """
+    return env.VenvEnvironment(
+        req_scheme,
+        pip_args=pip_args,
+        basename=basename,
+        env_name=env_name,
+        env_prefix=env_prefix,
+        dry_run=dry_run,
+    )
+
+
+def _run(x, a_callable, suppress_output):
+    """
+    Call `a_callable`, a method of `x`, and return what it wrote to stderr.
+
+    Unless `suppress_output` is true, let output through and return an
+    empty string.
+    """
+    if not suppress_output:
+        a_callable()
+        return ""
+    with ctx.capture_env(x, a_callable) as (_status, _stdout, stderr):
+        return stderr
+
+
 ########################################
 
 
 class TestEnv_100_VenvEnvironment(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Shared by this class's tests, which only read attributes.
+        cls._environment = staticmethod(ctx.environment_cache(env.VenvEnvironment))
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls._environment
+
     def setUp(self):
-        self.saved_requirements = reqs.REQUIREMENTS
+        pass
 
     def tearDown(self):
-        reqs.REQUIREMENTS = self.saved_requirements
+        pass
 
     def test_PV_ENV_VNV_000_instantiate_empty(self):
         with self.assertRaises(TypeError) as raised:
@@ -56,9 +125,11 @@ class TestEnv_100_VenvEnvironment(unittest.TestCase):
 
     def test_PV_ENV_VNV_010_requirements(self):
         dummy_requirements = {"dummy_req_source": ["dummy_requirement"]}
-        reqs.REQUIREMENTS = {"dummy_req_scheme": [dummy_requirements]}
-        x = env.VenvEnvironment("dummy_req_scheme")
-        self.assertListEqual(x.requirements.requirements, [dummy_requirements])
+        with patch.object(
+            reqs, "REQUIREMENTS", {"dummy_req_scheme": [dummy_requirements]}
+        ):
+            x = env.VenvEnvironment("dummy_req_scheme")
+            self.assertListEqual(x.requirements.requirements, [dummy_requirements])
 
     def test_PV_ENV_VNV_020_package_name(self):
         x = env.VenvEnvironment("dummy_req_scheme")
@@ -72,7 +143,7 @@ class TestEnv_100_VenvEnvironment(unittest.TestCase):
     )
     def test_PV_ENV_VNV_030_basename(self, name, basename, expected):
         kwargs = {} if basename is None else {"basename": basename}
-        x = env.VenvEnvironment("dummy_req_scheme", **kwargs)
+        x = self._environment("dummy_req_scheme", **kwargs)
         self.assertEqual(x.basename, expected)
 
     @parameterized.parameterized.expand(
@@ -83,176 +154,189 @@ class TestEnv_100_VenvEnvironment(unittest.TestCase):
     )
     def test_PV_ENV_VNV_040_env_name(self, name, env_name, expected):
         kwargs = {} if env_name is None else {"env_name": env_name}
-        x = env.VenvEnvironment("dummy_req_scheme", **kwargs)
+        x = self._environment("dummy_req_scheme", **kwargs)
         self.assertEqual(x.env_name, expected)
 
     @parameterized.parameterized.expand(
         [
-            ("default", None, None, ".venv"),
-            ("specified", "dummy-env", None, "dummy-env"),
+            ("env_dir_default", "env_dir", None, None, None, ".venv"),
+            ("env_dir_specified", "env_dir", None, "dummy-env", None, "dummy-env"),
             (
-                "with_prefix",
+                "env_dir_with_prefix",
+                "env_dir",
+                None,
                 None,
                 "dummy-prefix",
                 os.path.join("dummy-prefix", ".venv"),
             ),
             (
-                "specified_with_prefix",
+                "env_dir_specified_with_prefix",
+                "env_dir",
+                None,
                 "dummy-env",
                 "dummy-prefix",
                 os.path.join("dummy-prefix", "dummy-env"),
             ),
-        ]
-    )
-    def test_PV_ENV_VNV_050_env_dir(self, name, env_name, env_prefix, expected):
-        kwargs = {}
-        if env_name is not None:
-            kwargs["env_name"] = env_name
-        if env_prefix is not None:
-            kwargs["env_prefix"] = env_prefix
-        x = env.VenvEnvironment("dummy_req_scheme", **kwargs)
-        self.assertEqual(x.env_dir, expected)
-
-    @parameterized.parameterized.expand(
-        [
-            ("default", None, None, os.path.join(".venv", "bin")),
-            ("specified", "dummy-env", None, os.path.join("dummy-env", "bin")),
             (
-                "with_prefix",
+                "env_bin_dir_default",
+                "env_bin_dir",
+                None,
+                None,
+                None,
+                os.path.join(".venv", "bin"),
+            ),
+            (
+                "env_bin_dir_specified",
+                "env_bin_dir",
+                None,
+                "dummy-env",
+                None,
+                os.path.join("dummy-env", "bin"),
+            ),
+            (
+                "env_bin_dir_with_prefix",
+                "env_bin_dir",
+                None,
                 None,
                 "dummy-prefix",
                 os.path.join("dummy-prefix", ".venv", "bin"),
             ),
             (
-                "specified_with_prefix",
+                "env_bin_dir_specified_with_prefix",
+                "env_bin_dir",
+                None,
                 "dummy-env",
                 "dummy-prefix",
                 os.path.join("dummy-prefix", "dummy-env", "bin"),
             ),
-        ]
-    )
-    def test_PV_ENV_VNV_051_env_bin_dir(self, name, env_name, env_prefix, expected):
-        kwargs = {}
-        if env_name is not None:
-            kwargs["env_name"] = env_name
-        if env_prefix is not None:
-            kwargs["env_prefix"] = env_prefix
-        x = env.VenvEnvironment("dummy_req_scheme", **kwargs)
-        self.assertEqual(x.env_bin_dir, expected)
-
-    @parameterized.parameterized.expand(
-        [
             (
-                "default",
+                "env_python_default",
+                "env_python",
                 "dummy-python",
                 None,
                 None,
                 os.path.join(".venv", "bin", "dummy-python"),
             ),
             (
-                "specified",
+                "env_python_specified",
+                "env_python",
                 "dummy-python",
                 "dummy-env",
                 None,
                 os.path.join("dummy-env", "bin", "dummy-python"),
             ),
             (
-                "with_prefix",
+                "env_python_with_prefix",
+                "env_python",
                 "dummy-python",
                 None,
                 "dummy-prefix",
                 os.path.join("dummy-prefix", ".venv", "bin", "dummy-python"),
             ),
             (
-                "specified_with_prefix",
+                "env_python_specified_with_prefix",
+                "env_python",
                 "dummy-python",
                 "dummy-env",
                 "dummy-prefix",
                 os.path.join("dummy-prefix", "dummy-env", "bin", "dummy-python"),
             ),
             (
-                "with_path",
+                "env_python_with_path",
+                "env_python",
                 os.path.join(os.sep, "usr", "bin", "dummy-python"),
                 None,
                 None,
                 os.path.join(".venv", "bin", "dummy-python"),
             ),
             (
-                "specified_with_path",
+                "env_python_specified_with_path",
+                "env_python",
                 os.path.join(os.sep, "usr", "bin", "dummy-python"),
                 "dummy-env",
                 None,
                 os.path.join("dummy-env", "bin", "dummy-python"),
             ),
-        ]
-    )
-    def test_PV_ENV_VNV_052_env_python(
-        self, name, python, env_name, env_prefix, expected
-    ):
-        kwargs = {}
-        if python is not None:
-            kwargs["python"] = python
-        if env_name is not None:
-            kwargs["env_name"] = env_name
-        if env_prefix is not None:
-            kwargs["env_prefix"] = env_prefix
-        x = env.VenvEnvironment("dummy_req_scheme", **kwargs)
-        self.assertEqual(x.env_python, expected)
-
-    @parameterized.parameterized.expand(
-        [
-            ("default", None, None, os.path.join(os.getcwd(), ".venv")),
-            ("specified", "dummy-env", None, os.path.join(os.getcwd(), "dummy-env")),
             (
-                "with_prefix",
+                "abs_env_dir_default",
+                "abs_env_dir",
                 None,
-                "dummy-prefix",
-                os.path.join(os.getcwd(), "dummy-prefix", ".venv"),
+                None,
+                None,
+                ".venv",
             ),
             (
-                "specified_with_prefix",
+                "abs_env_dir_specified",
+                "abs_env_dir",
+                None,
+                "dummy-env",
+                None,
                 "dummy-env",
-                "dummy-prefix",
-                os.path.join(os.getcwd(), "dummy-prefix", "dummy-env"),
             ),
-        ]
-    )
-    def test_PV_ENV_VNV_051_abs_env_dir(self, name, env_name, env_prefix, expected):
-        kwargs = {}
-        if env_name is not None:
-            kwargs["env_name"] = env_name
-        if env_prefix is not None:
-            kwargs["env_prefix"] = env_prefix
-        x = env.VenvEnvironment("dummy_req_scheme", **kwargs)
-        self.assertEqual(x.abs_env_dir, expected)
-
-    @parameterized.parameterized.expand(
-        [
-            ("default", None, None, ".venv"),
-            ("specified", "dummy-env", None, "dummy-env"),
             (
-                "with_prefix",
+                "abs_env_dir_with_prefix",
+                "abs_env_dir",
+                None,
                 None,
                 "dummy-prefix",
                 os.path.join("dummy-prefix", ".venv"),
             ),
             (
-                "specified_with_prefix",
+                "abs_env_dir_specified_with_prefix",
+                "abs_env_dir",
+                None,
                 "dummy-env",
                 "dummy-prefix",
                 os.path.join("dummy-prefix", "dummy-env"),
             ),
+            (
+                "env_description_default",
+                "env_description",
+                None,
+                None,
+                None,
+                "Python venv at .venv",
+            ),
+            (
+                "env_description_specified",
+                "env_description",
+                None,
+                "dummy-env",
+                None,
+                "Python venv at dummy-env",
+            ),
+            (
+                "env_description_with_prefix",
+                "env_description",
+                None,
+                None,
+                "dummy-prefix",
+                "Python venv at " + os.path.join("dummy-prefix", ".venv"),
+            ),
+            (
+                "env_description_specified_with_prefix",
+                "env_description",
+                None,
+                "dummy-env",
+                "dummy-prefix",
+                "Python venv at " + os.path.join("dummy-prefix", "dummy-env"),
+            ),
         ]
     )
-    def test_PV_ENV_VNV_060_env_description(self, name, env_name, env_prefix, expected):
+    def test_PV_ENV_VNV_050_env_paths(
+        self, name, attr, python, env_name, env_prefix, expected
+    ):
         kwargs = {}
+        if python is not None:
+            kwargs["python"] = python
         if env_name is not None:
             kwargs["env_name"] = env_name
         if env_prefix is not None:
             kwargs["env_prefix"] = env_prefix
-        x = env.VenvEnvironment("dummy_req_scheme", **kwargs)
-        x.env_description
-        self.assertTrue(x.env_description.endswith(expected))
+        if attr == "abs_env_dir":  # resolved against the current directory
+            expected = os.path.join(os.getcwd(), expected)
+        x = self._environment("dummy_req_scheme", **kwargs)
+        self.assertEqual(getattr(x, attr), expected)
 
     @parameterized.parameterized.expand(
         [
@@ -270,20 +354,7 @@ class TestEnv_100_VenvEnvironment(unittest.TestCase):
         ]
     )
     def test_PV_ENV_VNV_100_create_dry_run(self, name, expected_text):
-        dummy_requirements = {const.FROM_FILES: ["dummy_requirements.txt"]}
-        reqs.REQUIREMENTS = {"dummy_req_scheme": [dummy_requirements]}
-        x = env.VenvEnvironment(
-            "dummy_req_scheme",
-            dry_run=True,
-            env_name=".dummy-venv",
-            ignore_preflight_checks=True,
-        )
-        with ctx.capture_to_file(x.create) as (
-            status,
-            _stdout,
-            stderr,
-        ):
-            self.assertTrue(expected_text in stderr)
+        self.assertIn(expected_text, _dry_run_stderr("create"))
 
     @parameterized.parameterized.expand(
         [
@@ -292,11 +363,7 @@ class TestEnv_100_VenvEnvironment(unittest.TestCase):
         ]
     )
     def test_PV_ENV_VNV_200_remove_dry_run(self, name, expected_text):
-        x = env.VenvEnvironment(
-            "dummy_req_scheme", dry_run=True, env_name=".dummy-venv"
-        )
-        with ctx.capture(x.remove) as (status, _stdout, stderr):
-            self.assertTrue(expected_text in stderr)
+        self.assertIn(expected_text, _dry_run_stderr("remove"))
 
     @parameterized.parameterized.expand(
         [
@@ -308,132 +375,78 @@ class TestEnv_100_VenvEnvironment(unittest.TestCase):
         ]
     )
     def test_PV_ENV_VNV_300_replace_dry_run(self, name, expected_text):
-        dummy_requirements = {const.FROM_FILES: ["dummy_requirements.txt"]}
-        reqs.REQUIREMENTS = {"dummy_req_scheme": [dummy_requirements]}
-        x = env.VenvEnvironment(
-            "dummy_req_scheme",
-            dry_run=True,
-            env_name=".dummy-venv",
-            ignore_preflight_checks=True,
-        )
-        with ctx.capture_to_file(x.replace) as (status, _stdout, stderr):
-            self.assertTrue(expected_text in stderr)
+        self.assertIn(expected_text, _dry_run_stderr("replace"))
 
 
 ########################################
 
 
 class TestEnv_110_VenvCreate(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.suppress_output = flags.should_suppress_output()
+        cls.stack = contextlib.ExitStack()
+        try:
+            cls.stack.enter_context(
+                ctx.project("dummy_package", filespecs=ctx.FILESPECS)
+            )
+        except BaseException:
+            cls.stack.close()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.stack.close()
+
     def setUp(self):
         pass
 
     def tearDown(self):
         pass
 
-    @parameterized.parameterized.expand(
-        [
-            ("plain_dry_run", reqs.REQ_SCHEME_PLAIN, True, None, None, []),
-            ("plain", reqs.REQ_SCHEME_PLAIN, False, None, None, []),
-            (
-                "plain_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                ".dummy-venv",
-                [],
-            ),
-            ("plain_env_name", reqs.REQ_SCHEME_PLAIN, False, None, ".dummy-venv", []),
-            ("dev_dry_run", reqs.REQ_SCHEME_DEV, True, None, None, []),
-            ("dev", reqs.REQ_SCHEME_DEV, False, None, None, []),
-            ("devplus_dry_run", reqs.REQ_SCHEME_DEVPLUS, True, None, None, []),
-            ("devplus", reqs.REQ_SCHEME_DEVPLUS, False, None, None, []),
-            ("frozen_dry_run", reqs.REQ_SCHEME_FROZEN, True, None, None, []),
-            ("frozen", reqs.REQ_SCHEME_FROZEN, False, None, None, []),
-            ("source_dry_run", reqs.REQ_SCHEME_SOURCE, True, None, None, []),
-            ("source", reqs.REQ_SCHEME_SOURCE, False, None, None, []),
-            ("wheel_dry_run", reqs.REQ_SCHEME_WHEEL, True, None, None, []),
-            ("wheel", reqs.REQ_SCHEME_WHEEL, False, None, None, []),
-            ("package_dry_run", reqs.REQ_SCHEME_PACKAGE, True, "argcomplete", None, []),
-            ("package", reqs.REQ_SCHEME_PACKAGE, False, "argcomplete", None, []),
-            ("pip_dry_run", reqs.REQ_SCHEME_PIP, True, None, None, ["argcomplete"]),
-            ("pip", reqs.REQ_SCHEME_PIP, False, None, None, ["argcomplete"]),
-        ]
-    )
+    @parameterized.parameterized.expand(CREATE_MATRIX)
     def test_PV_ENV_VNV_110_create(
         self, name, req_scheme, dry_run, basename, env_name, pip_args
     ):
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", filespecs=filespecs):
-            x = env.VenvEnvironment(
-                req_scheme, basename=basename, env_name=env_name, dry_run=dry_run
-            )
-            if not flags.should_suppress_output():
-                x.create()
-            else:
-                original_stderr = None
-                with ctx.capture_to_file(x.create) as (
-                    _status,
-                    _stdout,
-                    stderr,
-                ):
-                    original_stderr = stderr
-                testable_stderr = original_stderr.lower()
-                if "error" in testable_stderr:
-                    print(original_stderr, file=stderr)
-                self.assertNotIn("error", testable_stderr)
+        with ctx.fake_venv_subprocesses():
+            x = self._check_create(req_scheme, dry_run, basename, env_name)
+        self.assertEqual(os.path.isdir(x.env_dir), not dry_run)
 
-    @parameterized.parameterized.expand(
-        [
-            ("plain_dry_run", reqs.REQ_SCHEME_PLAIN, True, None, None, []),
-            ("plain", reqs.REQ_SCHEME_PLAIN, False, None, None, []),
-            (
-                "plain_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                ".dummy-venv",
-                [],
-            ),
-            ("plain_env_name", reqs.REQ_SCHEME_PLAIN, False, None, ".dummy-venv", []),
-            ("dev_dry_run", reqs.REQ_SCHEME_DEV, True, None, None, []),
-            ("dev", reqs.REQ_SCHEME_DEV, False, None, None, []),
-            ("devplus_dry_run", reqs.REQ_SCHEME_DEVPLUS, True, None, None, []),
-            ("devplus", reqs.REQ_SCHEME_DEVPLUS, False, None, None, []),
-            ("frozen_dry_run", reqs.REQ_SCHEME_FROZEN, True, None, None, []),
-            ("frozen", reqs.REQ_SCHEME_FROZEN, False, None, None, []),
-            ("source_dry_run", reqs.REQ_SCHEME_SOURCE, True, None, None, []),
-            ("source", reqs.REQ_SCHEME_SOURCE, False, None, None, []),
-            ("wheel_dry_run", reqs.REQ_SCHEME_WHEEL, True, None, None, []),
-            ("wheel", reqs.REQ_SCHEME_WHEEL, False, None, None, []),
-            ("package_dry_run", reqs.REQ_SCHEME_PACKAGE, True, "argcomplete", None, []),
-            ("package", reqs.REQ_SCHEME_PACKAGE, False, "argcomplete", None, []),
-            ("pip_dry_run", reqs.REQ_SCHEME_PIP, True, None, None, ["argcomplete"]),
-            ("pip", reqs.REQ_SCHEME_PIP, False, None, None, ["argcomplete"]),
-        ]
-    )
-    def test_PV_ENV_VNV_111_create_no_setup(
+    @parameterized.parameterized.expand(row for row in CREATE_MATRIX if not row[2])
+    @unittest.skipUnless(flags.should_run_long_tests(), flags.SKIP_LONG_RUNNING_MESSAGE)
+    def test_PV_ENV_VNV_113_create_for_real(
         self, name, req_scheme, dry_run, basename, env_name, pip_args
     ):
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
+        self._check_create(req_scheme, dry_run, basename, env_name)
+
+    def _check_create(self, req_scheme, dry_run, basename, env_name):
+        x = env.VenvEnvironment(
+            req_scheme, basename=basename, env_name=env_name, dry_run=dry_run
+        )
+        self.addCleanup(shutil.rmtree, x.env_dir, ignore_errors=True)
+        stderr = _run(x, x.create, self.suppress_output)
+        self.assertNotRegex(stderr, ctx.ERROR_PATTERN)
+        return x
+
+    @parameterized.parameterized.expand(row for row in CREATE_MATRIX if row[2])
+    def test_PV_ENV_VNV_111_create_no_setup_dry_run(
+        self, name, req_scheme, dry_run, basename, env_name, pip_args
+    ):
+        self._check_create_no_setup(req_scheme, dry_run, basename, env_name)
+
+    @parameterized.parameterized.expand(row for row in CREATE_MATRIX if not row[2])
+    @unittest.skipUnless(flags.should_run_long_tests(), flags.SKIP_LONG_RUNNING_MESSAGE)
+    def test_PV_ENV_VNV_112_create_no_setup(
+        self, name, req_scheme, dry_run, basename, env_name, pip_args
+    ):
+        self._check_create_no_setup(req_scheme, dry_run, basename, env_name)
+
+    def _check_create_no_setup(self, req_scheme, dry_run, basename, env_name):
         should_raise = not (
             req_scheme in {reqs.REQ_SCHEME_PIP}
             or (req_scheme in {reqs.REQ_SCHEME_PACKAGE} and basename is not None)
         )
-        with ctx.project("dummy_package", filespecs=filespecs, omit_setup=True):
+        with ctx.project("dummy_package", filespecs=ctx.FILESPECS, omit_setup=True):
             with ctx.capture_output_to_file():
                 x = env.VenvEnvironment(
                     req_scheme, basename=basename, env_name=env_name, dry_run=dry_run
@@ -478,37 +491,19 @@ class TestEnv_110_VenvCreate(unittest.TestCase):
     def test_PV_ENV_VNV_115_create_with_prefix(
         self, name, req_scheme, dry_run, basename, env_name, env_prefix
     ):
-        dirs = ["dummy-prefix"]
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", dirs=dirs, filespecs=filespecs):
-            x = env.VenvEnvironment(
-                req_scheme,
-                basename=basename,
-                env_name=env_name,
-                env_prefix=env_prefix,
-                dry_run=dry_run,
-            )
-            if not flags.should_suppress_output():
-                x.create()
-            else:
-                original_stderr = None
-                with ctx.capture_to_file(x.create) as (
-                    _status,
-                    _stdout,
-                    stderr,
-                ):
-                    original_stderr = stderr
-                testable_stderr = original_stderr.lower()
-                if "error" in testable_stderr:
-                    print(original_stderr, file=stderr)
-                self.assertNotIn("error", testable_stderr)
+        x = env.VenvEnvironment(
+            req_scheme,
+            basename=basename,
+            env_name=env_name,
+            env_prefix=env_prefix,
+            dry_run=dry_run,
+        )
+        if env_prefix == os.curdir:
+            self.addCleanup(shutil.rmtree, x.env_dir, ignore_errors=True)
+        else:  # creating the environment creates its prefix directory, too
+            self.addCleanup(shutil.rmtree, env_prefix, ignore_errors=True)
+        stderr = _run(x, x.create, self.suppress_output)
+        self.assertNotRegex(stderr, ctx.ERROR_PATTERN)
 
     @parameterized.parameterized.expand(
         [
@@ -530,15 +525,7 @@ class TestEnv_110_VenvCreate(unittest.TestCase):
                 req_scheme, basename=basename, env_name=env_name, dry_run=dry_run
             )
             with self.assertRaises(exc.MissingRequirementsError):
-                if not flags.should_suppress_output():
-                    x.create()
-                else:
-                    with ctx.capture_to_file(x.create) as (
-                        _status,
-                        _stdout,
-                        _stderr,
-                    ):
-                        pass
+                _run(x, x.create, self.suppress_output)
 
     @parameterized.parameterized.expand(
         [
@@ -557,430 +544,141 @@ class TestEnv_110_VenvCreate(unittest.TestCase):
     def test_PV_ENV_VNV_130_create_duplicate(
         self, name, req_scheme, dry_run, env_name, should_raise
     ):
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", filespecs=filespecs):
-            x = env.VenvEnvironment(req_scheme, env_name=env_name, dry_run=False)
-            if not flags.should_suppress_output():
-                x.create()
-            else:
-                with ctx.capture_to_file(x.create) as (_status, _stdout, _stderr):
-                    pass
-            x = env.VenvEnvironment(req_scheme, env_name=env_name, dry_run=dry_run)
-            if should_raise:
-                with self.assertRaises(exc.EnvExistsError):
-                    if not flags.should_suppress_output():
-                        x.create()
-                    else:
-                        with ctx.capture_to_file(x.create) as (
-                            _status,
-                            _stdout,
-                            _stderr,
-                        ):
-                            pass
-            else:
-                if not flags.should_suppress_output():
-                    x.create()
-                else:
-                    original_stderr = None
-                    with ctx.capture_to_file(x.create) as (_status, _stdout, stderr):
-                        original_stderr = stderr
-                    testable_stderr = original_stderr.lower()
-                    if "error" in testable_stderr:
-                        print(original_stderr, file=stderr)
-                    self.assertNotIn("error", testable_stderr)
+        x = env.VenvEnvironment(req_scheme, env_name=env_name, dry_run=False)
+        self.addCleanup(shutil.rmtree, x.env_dir, ignore_errors=True)
+        _run(x, x.create, self.suppress_output)
+        x = env.VenvEnvironment(req_scheme, env_name=env_name, dry_run=dry_run)
+        if should_raise:
+            with self.assertRaises(exc.EnvExistsError):
+                _run(x, x.create, self.suppress_output)
+        else:
+            stderr = _run(x, x.create, self.suppress_output)
+            self.assertNotRegex(stderr, ctx.ERROR_PATTERN)
 
 
 ########################################
 
 
 class TestEnv_120_VenvRemove(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.suppress_output = flags.should_suppress_output()
+        cls.stack = contextlib.ExitStack()
+        try:
+            # Stands in for the environment each test removes.
+            cls.venv_cache = cls.stack.enter_context(ctx.prebuilt_venv())
+            cls.stack.enter_context(
+                ctx.project("dummy_package", filespecs=ctx.FILESPECS)
+            )
+        except BaseException:
+            cls.stack.close()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.stack.close()
+
     def setUp(self):
         pass
 
     def tearDown(self):
         pass
 
-    @parameterized.parameterized.expand(
-        [
-            ("plain_dry_run", reqs.REQ_SCHEME_PLAIN, True, None, None, None, []),
-            ("plain", reqs.REQ_SCHEME_PLAIN, False, None, None, None, []),
-            (
-                "plain_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                ".dummy-venv",
-                None,
-                [],
-            ),
-            (
-                "plain_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                False,
-                None,
-                ".dummy-venv",
-                None,
-                [],
-            ),
-            (
-                "prefix_dry_run",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                None,
-                "dummy-prefix",
-                [],
-            ),
-            ("prefix", reqs.REQ_SCHEME_PLAIN, False, None, None, "dummy-prefix", []),
-            (
-                "prefix_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                ".dummy-venv",
-                "dummy-prefix",
-                [],
-            ),
-            (
-                "prefix_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                False,
-                None,
-                ".dummy-venv",
-                "dummy-prefix",
-                [],
-            ),
-            ("dev_dry_run", reqs.REQ_SCHEME_DEV, True, None, None, None, []),
-            ("dev", reqs.REQ_SCHEME_DEV, False, None, None, None, []),
-            ("devplus_dry_run", reqs.REQ_SCHEME_DEVPLUS, True, None, None, None, []),
-            ("devplus", reqs.REQ_SCHEME_DEVPLUS, False, None, None, None, []),
-            ("frozen_dry_run", reqs.REQ_SCHEME_FROZEN, True, None, None, None, []),
-            ("frozen", reqs.REQ_SCHEME_FROZEN, False, None, None, None, []),
-            ("source_dry_run", reqs.REQ_SCHEME_SOURCE, True, None, None, None, []),
-            ("source", reqs.REQ_SCHEME_SOURCE, False, None, None, None, []),
-            ("wheel_dry_run", reqs.REQ_SCHEME_WHEEL, True, None, None, None, []),
-            ("wheel", reqs.REQ_SCHEME_WHEEL, False, None, None, None, []),
-            (
-                "package_dry_run",
-                reqs.REQ_SCHEME_PACKAGE,
-                True,
-                "argcomplete",
-                None,
-                None,
-                [],
-            ),
-            ("package", reqs.REQ_SCHEME_PACKAGE, False, "argcomplete", None, None, []),
-            (
-                "pip_dry_run",
-                reqs.REQ_SCHEME_PIP,
-                True,
-                None,
-                None,
-                None,
-                ["argcomplete"],
-            ),
-            ("pip", reqs.REQ_SCHEME_PIP, False, None, None, None, ["argcomplete"]),
-        ]
-    )
+    @parameterized.parameterized.expand(SCHEME_MATRIX)
     def test_PV_ENV_VNV_210_remove(
         self, name, req_scheme, dry_run, basename, env_name, env_prefix, pip_args
     ):
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", filespecs=filespecs):
-            x = env.VenvEnvironment(
-                req_scheme,
-                pip_args=pip_args,
-                basename=basename,
-                env_name=env_name,
-                env_prefix=env_prefix,
-                dry_run=dry_run,
-            )
-            y = env.VenvEnvironment(
-                req_scheme,
-                pip_args=pip_args,
-                basename=basename,
-                env_name=env_name,
-                env_prefix=env_prefix,
-                dry_run=False,
-            )
-            if not flags.should_suppress_output():
-                x.remove()  # remove non-existent
-                y.create()
-                x.remove()  # remove existing
-            else:
-                original_stderrs = []
-                with ctx.capture_to_file(x.remove) as (_status, _stdout, stderr):
-                    original_stderrs.append(stderr)
-                with ctx.capture_to_file(y.create) as (_status, _stdout, stderr):
-                    original_stderrs.append(stderr)
-                with ctx.capture_to_file(x.remove) as (_status, _stdout, stderr):
-                    original_stderrs.append(stderr)
-                testable_stderrs = [text.lower() for text in original_stderrs]
-                for i, text in enumerate(testable_stderrs):
-                    if "error" in text:
-                        print(original_stderrs[i], file=stderr)
-                    self.assertNotIn("error", text)
+        x = _new_environment(
+            req_scheme, dry_run, basename, env_name, env_prefix, pip_args
+        )
+        self.addCleanup(shutil.rmtree, x.env_dir, ignore_errors=True)
+
+        def remove_twice():
+            x.remove()  # remove non-existent
+            shutil.copytree(self.venv_cache, x.env_dir, symlinks=True)
+            x.remove()  # remove existing
+
+        stderr = _run(x, remove_twice, self.suppress_output)
+        self.assertNotRegex(stderr, ctx.ERROR_PATTERN)
 
 
 ########################################
 
 
 class TestEnv_130_VenvReplace(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.suppress_output = flags.should_suppress_output()
+        cls.stack = contextlib.ExitStack()
+        try:
+            # Rows that replace an existing environment copy this one in.
+            cls.venv_cache = cls.stack.enter_context(ctx.prebuilt_venv())
+            cls.stack.enter_context(
+                ctx.project("dummy_package", filespecs=ctx.FILESPECS)
+            )
+        except BaseException:
+            cls.stack.close()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.stack.close()
+
     def setUp(self):
         pass
 
     def tearDown(self):
         pass
 
-    @parameterized.parameterized.expand(
-        [
-            ("plain_dry_run", reqs.REQ_SCHEME_PLAIN, True, None, None, None, []),
-            ("plain", reqs.REQ_SCHEME_PLAIN, False, None, None, None, []),
-            (
-                "plain_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                ".dummy-venv",
-                None,
-                [],
-            ),
-            (
-                "plain_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                False,
-                None,
-                ".dummy-venv",
-                None,
-                [],
-            ),
-            (
-                "prefix_dry_run",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                None,
-                "dummy-prefix",
-                [],
-            ),
-            ("prefix", reqs.REQ_SCHEME_PLAIN, False, None, None, "dummy-prefix", []),
-            (
-                "prefix_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                ".dummy-venv",
-                "dummy-prefix",
-                [],
-            ),
-            (
-                "prefix_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                False,
-                None,
-                ".dummy-venv",
-                "dummy-prefix",
-                [],
-            ),
-            ("dev_dry_run", reqs.REQ_SCHEME_DEV, True, None, None, None, []),
-            ("dev", reqs.REQ_SCHEME_DEV, False, None, None, None, []),
-            ("devplus_dry_run", reqs.REQ_SCHEME_DEVPLUS, True, None, None, None, []),
-            ("devplus", reqs.REQ_SCHEME_DEVPLUS, False, None, None, None, []),
-            ("frozen_dry_run", reqs.REQ_SCHEME_FROZEN, True, None, None, None, []),
-            ("frozen", reqs.REQ_SCHEME_FROZEN, False, None, None, None, []),
-            ("source_dry_run", reqs.REQ_SCHEME_SOURCE, True, None, None, None, []),
-            ("source", reqs.REQ_SCHEME_SOURCE, False, None, None, None, []),
-            ("wheel_dry_run", reqs.REQ_SCHEME_WHEEL, True, None, None, None, []),
-            ("wheel", reqs.REQ_SCHEME_WHEEL, False, None, None, None, []),
-            (
-                "package_dry_run",
-                reqs.REQ_SCHEME_PACKAGE,
-                True,
-                "argcomplete",
-                None,
-                None,
-                [],
-            ),
-            ("package", reqs.REQ_SCHEME_PACKAGE, False, "argcomplete", None, None, []),
-            (
-                "pip_dry_run",
-                reqs.REQ_SCHEME_PIP,
-                True,
-                None,
-                None,
-                None,
-                ["argcomplete"],
-            ),
-            ("pip", reqs.REQ_SCHEME_PIP, False, None, None, None, ["argcomplete"]),
-        ]
-    )
+    @parameterized.parameterized.expand(SCHEME_MATRIX)
     def test_PV_ENV_VNV_310_replace_nonexistent(
         self, name, req_scheme, dry_run, basename, env_name, env_prefix, pip_args
     ):
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", filespecs=filespecs):
-            x = env.VenvEnvironment(
-                req_scheme,
-                pip_args=pip_args,
-                basename=basename,
-                env_name=env_name,
-                env_prefix=env_prefix,
-                dry_run=dry_run,
+        with ctx.fake_venv_subprocesses():
+            x = self._check_replace(
+                False, req_scheme, dry_run, basename, env_name, env_prefix, pip_args
             )
-            if not flags.should_suppress_output():
-                x.replace()
-            else:
-                original_stderrs = []
-                with ctx.capture_to_file(x.replace) as (_status, _stdout, stderr):
-                    original_stderrs.append(stderr)
-                testable_stderrs = [text.lower() for text in original_stderrs]
-                for i, text in enumerate(testable_stderrs):
-                    if "error" in text:
-                        print(original_stderrs[i], file=stderr)
-                    self.assertNotIn("error", text)
+        self.assertEqual(os.path.isdir(x.env_dir), not dry_run)
 
-    @parameterized.parameterized.expand(
-        [
-            ("plain_dry_run", reqs.REQ_SCHEME_PLAIN, True, None, None, None, []),
-            ("plain", reqs.REQ_SCHEME_PLAIN, False, None, None, None, []),
-            (
-                "plain_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                ".dummy-venv",
-                None,
-                [],
-            ),
-            (
-                "plain_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                False,
-                None,
-                ".dummy-venv",
-                None,
-                [],
-            ),
-            (
-                "prefix_dry_run",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                None,
-                "dummy-prefix",
-                [],
-            ),
-            ("prefix", reqs.REQ_SCHEME_PLAIN, False, None, None, "dummy-prefix", []),
-            (
-                "prefix_dry_run_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                True,
-                None,
-                ".dummy-venv",
-                "dummy-prefix",
-                [],
-            ),
-            (
-                "prefix_env_name",
-                reqs.REQ_SCHEME_PLAIN,
-                False,
-                None,
-                ".dummy-venv",
-                "dummy-prefix",
-                [],
-            ),
-            ("dev_dry_run", reqs.REQ_SCHEME_DEV, True, None, None, None, []),
-            ("dev", reqs.REQ_SCHEME_DEV, False, None, None, None, []),
-            ("devplus_dry_run", reqs.REQ_SCHEME_DEVPLUS, True, None, None, None, []),
-            ("devplus", reqs.REQ_SCHEME_DEVPLUS, False, None, None, None, []),
-            ("frozen_dry_run", reqs.REQ_SCHEME_FROZEN, True, None, None, None, []),
-            ("frozen", reqs.REQ_SCHEME_FROZEN, False, None, None, None, []),
-            ("source_dry_run", reqs.REQ_SCHEME_SOURCE, True, None, None, None, []),
-            ("source", reqs.REQ_SCHEME_SOURCE, False, None, None, None, []),
-            ("wheel_dry_run", reqs.REQ_SCHEME_WHEEL, True, None, None, None, []),
-            ("wheel", reqs.REQ_SCHEME_WHEEL, False, None, None, None, []),
-            (
-                "package_dry_run",
-                reqs.REQ_SCHEME_PACKAGE,
-                True,
-                "argcomplete",
-                None,
-                None,
-                [],
-            ),
-            ("package", reqs.REQ_SCHEME_PACKAGE, False, "argcomplete", None, None, []),
-            (
-                "pip_dry_run",
-                reqs.REQ_SCHEME_PIP,
-                True,
-                None,
-                None,
-                None,
-                ["argcomplete"],
-            ),
-            ("pip", reqs.REQ_SCHEME_PIP, False, None, None, None, ["argcomplete"]),
-        ]
-    )
+    @parameterized.parameterized.expand(row for row in SCHEME_MATRIX if not row[2])
+    @unittest.skipUnless(flags.should_run_long_tests(), flags.SKIP_LONG_RUNNING_MESSAGE)
+    def test_PV_ENV_VNV_311_replace_nonexistent_for_real(
+        self, name, req_scheme, dry_run, basename, env_name, env_prefix, pip_args
+    ):
+        self._check_replace(
+            False, req_scheme, dry_run, basename, env_name, env_prefix, pip_args
+        )
+
+    @parameterized.parameterized.expand(SCHEME_MATRIX)
     def test_PV_ENV_VNV_320_replace_existing(
         self, name, req_scheme, dry_run, basename, env_name, env_prefix, pip_args
     ):
-        filespecs = {
-            "requirements.txt": "argcomplete",
-            "requirements_dev.txt": "argcomplete",
-            "requirements_frozen.txt": "argcomplete == 1.12.3",
-            os.path.join("dev", "requirements_build.txt"): "",
-            os.path.join("dev", "requirements_dev.txt"): "",
-            os.path.join("dev", "requirements_test.txt"): "parameterized",
-        }
-        with ctx.project("dummy_package", filespecs=filespecs):
-            x = env.VenvEnvironment(
-                req_scheme,
-                pip_args=pip_args,
-                basename=basename,
-                env_name=env_name,
-                env_prefix=env_prefix,
-                dry_run=dry_run,
-            )
-            y = env.VenvEnvironment(
-                req_scheme,
-                pip_args=pip_args,
-                basename=basename,
-                env_name=env_name,
-                env_prefix=env_prefix,
-                dry_run=False,
+        with ctx.fake_venv_subprocesses():
+            x = self._check_replace(
+                True, req_scheme, dry_run, basename, env_name, env_prefix, pip_args
             )
-            if not flags.should_suppress_output():
-                y.create()
-                x.replace()
-            else:
-                original_stderrs = []
-                with ctx.capture_to_file(y.create) as (_status, _stdout, stderr):
-                    original_stderrs.append(stderr)
-                with ctx.capture_to_file(x.remove) as (_status, _stdout, stderr):
-                    original_stderrs.append(stderr)
-                testable_stderrs = [text.lower() for text in original_stderrs]
-                for i, text in enumerate(testable_stderrs):
-                    if "error" in text:
-                        print(original_stderrs[i], file=stderr)
-                    self.assertNotIn("error", text)
+        # A dry run leaves the existing environment alone; a real one
+        # replaces it with the (faked) new one.
+        self.assertEqual(os.path.exists(os.path.join(x.env_dir, "pyvenv.cfg")), dry_run)
+
+    @parameterized.parameterized.expand(row for row in SCHEME_MATRIX if not row[2])
+    @unittest.skipUnless(flags.should_run_long_tests(), flags.SKIP_LONG_RUNNING_MESSAGE)
+    def test_PV_ENV_VNV_321_replace_existing_for_real(
+        self, name, req_scheme, dry_run, basename, env_name, env_prefix, pip_args
+    ):
+        self._check_replace(
+            True, req_scheme, dry_run, basename, env_name, env_prefix, pip_args
+        )
+
+    def _check_replace(
+        self, existing, req_scheme, dry_run, basename, env_name, env_prefix, pip_args
+    ):
+        x = _new_environment(
+            req_scheme, dry_run, basename, env_name, env_prefix, pip_args
+        )
+        self.addCleanup(shutil.rmtree, x.env_dir, ignore_errors=True)
+        if existing:
+            shutil.copytree(self.venv_cache, x.env_dir, symlinks=True)
+        stderr = _run(x, x.replace, self.suppress_output)
+        self.assertNotRegex(stderr, ctx.ERROR_PATTERN)
+        return x
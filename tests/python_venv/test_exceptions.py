@@ -2,10 +2,25 @@
 
 import unittest
 
-import parameterized  # https://pypi.org/project/parameterized/
-
 from python_venv import exceptions as exc
 
+HIERARCHY = (
+    ("base_error", exc.BaseError, exc.BaseError),
+    ("base_error_as_exc", exc.BaseError, Exception),
+    ("env_error", exc.EnvError, exc.EnvError),
+    ("req_error", exc.RequirementsError, exc.RequirementsError),
+    ("env_error_as_base", exc.EnvError, exc.BaseError),
+    ("req_error_as_base", exc.RequirementsError, exc.BaseError),
+    ("env_not_found", exc.EnvNotFoundError, exc.EnvNotFoundError),
+    ("env_exists", exc.EnvExistsError, exc.EnvExistsError),
+    ("env_occluded", exc.EnvOccludedError, exc.EnvOccludedError),
+    ("env_not_found_as_env", exc.EnvNotFoundError, exc.EnvError),
+    ("env_exists_as_env", exc.EnvExistsError, exc.EnvError),
+    ("env_occluded_as_env", exc.EnvOccludedError, exc.EnvError),
+    ("missing_req", exc.MissingRequirementsError, exc.MissingRequirementsError),
+    ("missing_req_as_req", exc.MissingRequirementsError, exc.RequirementsError),
+)
+
 ########################################
 # Tests
 
@@ -26,24 +41,9 @@ class TestExceptions(unittest.TestCase):
         _ = exc.EnvOccludedError
         _ = exc.MissingRequirementsError
 
-    @parameterized.parameterized.expand(
-        [
-            ("base_error", exc.BaseError, exc.BaseError),
-            ("base_error_as_exc", exc.BaseError, Exception),
-            ("env_error", exc.EnvError, exc.EnvError),
-            ("req_error", exc.RequirementsError, exc.RequirementsError),
-            ("env_error_as_base", exc.EnvError, exc.BaseError),
-            ("req_error_as_base", exc.RequirementsError, exc.BaseError),
-            ("env_not_found", exc.EnvNotFoundError, exc.EnvNotFoundError),
-            ("env_exists", exc.EnvExistsError, exc.EnvExistsError),
-            ("env_occluded", exc.EnvOccludedError, exc.EnvOccludedError),
-            ("env_not_found_as_env", exc.EnvNotFoundError, exc.EnvError),
-            ("env_exists_as_env", exc.EnvExistsError, exc.EnvError),
-            ("env_occluded_as_env", exc.EnvOccludedError, exc.EnvError),
-            ("missing_req", exc.MissingRequirementsError, exc.MissingRequirementsError),
-            ("missing_req_as_req", exc.MissingRequirementsError, exc.RequirementsError),
-        ]
-    )
-    def test_PV_XC_010_raise(self, name, exception, catch):
-        with self.assertRaises(catch):
-            raise exception
+    def test_PV_XC_010_hierarchy(self):
+        # `raise exception` is caught by `except catch` exactly when
+        # `exception` is a subclass of `catch`.
+        for name, exception, catch in HIERARCHY:
+            with self.subTest(name):
+                self.assertTrue(issubclass(exception, catch))
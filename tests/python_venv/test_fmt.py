@@ -11,6 +11,12 @@ from python_venv import fmt
 
 
 class TestFormat(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Shared by the tests that only query a formatter.
+        cls.dummy_formatter = fmt.Formatter(dummy_key="dummy_value")
+        cls.empty_formatter = fmt.Formatter()
+
     def setUp(self):
         pass
 
@@ -39,23 +45,23 @@ class TestFormat(unittest.TestCase):
         self.assertListEqual(x.keys(), expected)
 
     def test_PV_FM_020_has(self):
-        x = fmt.Formatter(dummy_key="dummy_value")
+        x = self.dummy_formatter
         self.assertTrue(x.has("dummy_key"))
 
     def test_PV_FM_030_get(self):
-        x = fmt.Formatter(dummy_key="dummy_value")
+        x = self.dummy_formatter
         self.assertEqual(x.get("dummy_key"), "dummy_value")
 
     def test_PV_FM_031_get_default(self):
-        x = fmt.Formatter()
+        x = self.empty_formatter
         self.assertIsNone(x.get("dummy_key"))
 
     def test_PV_FM_032_get_default_value(self):
-        x = fmt.Formatter()
+        x = self.empty_formatter
         self.assertEqual(x.get("dummy_key", default="dummy_value"), "dummy_value")
 
     def test_PV_FM_033_get_raises(self):
-        x = fmt.Formatter()
+        x = self.empty_formatter
         with self.assertRaises(KeyError):
             x.get("dummy_key", should_raise=True)
 
@@ -117,11 +123,9 @@ class TestFormat(unittest.TestCase):
     )
     def test_PV_FM_100_format(self, name, kwargs, template, expected):
         x = fmt.Formatter(**kwargs)
-        result = x.format(template)
-        if isinstance(template, str):
-            self.assertEqual(result, expected)
-        else:
-            self.assertListEqual(result, expected)
+        # A string formats to a string, a list to a list; assertEqual
+        # compares lists with assertListEqual by itself.
+        self.assertEqual(x.format(template), expected)
 
     def test_PV_FM_101_format_raises(self):
         x = fmt.Formatter()
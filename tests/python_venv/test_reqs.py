@@ -1,73 +1,100 @@
 """Provide unit tests for `~python_venv.reqs`:py:mod:."""
 
+import functools
 import unittest
+from unittest.mock import patch
 
 import parameterized  # https://pypi.org/project/parameterized/
 
 from python_venv import const, exceptions, reqs
 
+SYMBOLS = (
+    "REQUIREMENTS_PLAIN",
+    "REQUIREMENTS_DEV",
+    "REQUIREMENTS_DEVPLUS",
+    "REQUIREMENTS_TEST",
+    "REQUIREMENTS_FROZEN",
+    "REQUIREMENTS_BUILD",
+    "REQUIREMENTS_PACKAGE",
+    "REQUIREMENTS_PIP",
+    "REQUIREMENTS_BUILD_SDIST",
+    "REQUIREMENTS_SDISTFILE",
+    "REQUIREMENTS_BUILD_WHEEL",
+    "REQUIREMENTS_WHEELFILE",
+    "REQUIREMENTS_VENV",
+    "REQ_SCHEME_PLAIN",
+    "REQ_SCHEME_DEV",
+    "REQ_SCHEME_DEVPLUS",
+    "REQ_SCHEME_FROZEN",
+    "REQ_SCHEME_PACKAGE",
+    "REQ_SCHEME_PIP",
+    "REQ_SCHEME_SOURCE",
+    "REQ_SCHEME_WHEEL",
+    "REQ_SCHEME_VENV",
+    "DEV_REQ_SCHEMES",
+    "ALL_REQ_SCHEMES",
+)
+REQ_SCHEME_SYMBOLS = tuple(
+    (f"req_scheme_{scheme}", f"REQ_SCHEME_{scheme.upper()}", scheme)
+    for scheme in (
+        "plain",
+        "dev",
+        "devplus",
+        "frozen",
+        "package",
+        "pip",
+        "source",
+        "wheel",
+        "venv",
+    )
+)
+DUMMY_REQUIREMENTS = {
+    "dummy_req_scheme": [
+        {"from_dummy": ["dummy_one", "dummy_two"]},
+    ],
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _dummy_scheme(**kwargs):
+    """
+    Return one dummy `ReqScheme` per distinct set of arguments, for tests
+    that only call its helper methods.
+    """
+    with patch.object(reqs, "REQUIREMENTS", DUMMY_REQUIREMENTS):
+        return reqs.ReqScheme("dummy_req_scheme", **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _venv_packages(supplemental_scheme):
+    """Return the set of packages the venv requirements scheme installs."""
+    entries = reqs.SPECIAL_REQUIREMENTS[reqs.REQ_SCHEME_VENV][
+        "default" if supplemental_scheme is None else supplemental_scheme
+    ]
+    packages = set()
+    for entry in entries:
+        packages.update(entry.get(const.FROM_PACKAGES, []))
+    return frozenset(packages)
+
+
 ########################################
 # Tests
 
 
 class TestRequirements(unittest.TestCase):
-    def setUp(self):
-        self.saved_requirements = reqs.REQUIREMENTS
-
-    def tearDown(self):
-        reqs.REQUIREMENTS = self.saved_requirements
-
     def _set_dummy_requirements(self):
-        self.dummy_requirements = [
-            {"from_dummy": ["dummy_one", "dummy_two"]},
-        ]
-        reqs.REQUIREMENTS = {
-            "dummy_req_scheme": self.dummy_requirements,
-        }
+        self.dummy_requirements = DUMMY_REQUIREMENTS["dummy_req_scheme"]
+        patcher = patch.object(reqs, "REQUIREMENTS", dict(DUMMY_REQUIREMENTS))
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_PV_RQ_000_symbols_exist(self):
-        _ = reqs.REQUIREMENTS_PLAIN
-        _ = reqs.REQUIREMENTS_DEV
-        _ = reqs.REQUIREMENTS_DEVPLUS
-        _ = reqs.REQUIREMENTS_TEST
-        _ = reqs.REQUIREMENTS_FROZEN
-        _ = reqs.REQUIREMENTS_BUILD
-        _ = reqs.REQUIREMENTS_PACKAGE
-        _ = reqs.REQUIREMENTS_PIP
-        _ = reqs.REQUIREMENTS_BUILD_SDIST
-        _ = reqs.REQUIREMENTS_SDISTFILE
-        _ = reqs.REQUIREMENTS_BUILD_WHEEL
-        _ = reqs.REQUIREMENTS_WHEELFILE
-        _ = reqs.REQUIREMENTS_VENV
-
-        _ = reqs.REQ_SCHEME_PLAIN
-        _ = reqs.REQ_SCHEME_DEV
-        _ = reqs.REQ_SCHEME_DEVPLUS
-        _ = reqs.REQ_SCHEME_FROZEN
-        _ = reqs.REQ_SCHEME_PACKAGE
-        _ = reqs.REQ_SCHEME_PIP
-        _ = reqs.REQ_SCHEME_SOURCE
-        _ = reqs.REQ_SCHEME_WHEEL
-        _ = reqs.REQ_SCHEME_VENV
-
-        _ = reqs.DEV_REQ_SCHEMES
-        _ = reqs.ALL_REQ_SCHEMES
+        missing = [name for name in SYMBOLS if not hasattr(reqs, name)]
+        self.assertListEqual(missing, [])
 
-    @parameterized.parameterized.expand(
-        [
-            ("req_scheme_plain", reqs.REQ_SCHEME_PLAIN, "plain"),
-            ("req_scheme_dev", reqs.REQ_SCHEME_DEV, "dev"),
-            ("req_scheme_devplus", reqs.REQ_SCHEME_DEVPLUS, "devplus"),
-            ("req_scheme_frozen", reqs.REQ_SCHEME_FROZEN, "frozen"),
-            ("req_scheme_package", reqs.REQ_SCHEME_PACKAGE, "package"),
-            ("req_scheme_pip", reqs.REQ_SCHEME_PIP, "pip"),
-            ("req_scheme_source", reqs.REQ_SCHEME_SOURCE, "source"),
-            ("req_scheme_wheel", reqs.REQ_SCHEME_WHEEL, "wheel"),
-            ("req_scheme_venv", reqs.REQ_SCHEME_VENV, "venv"),
-        ]
-    )
-    def test_PV_RQ_001_symbol_interfaces(self, name, symbol, expected):
-        self.assertEqual(symbol, expected)
+    @parameterized.parameterized.expand(REQ_SCHEME_SYMBOLS)
+    def test_PV_RQ_001_symbol_interfaces(self, name, symbol_name, expected):
+        self.assertEqual(getattr(reqs, symbol_name), expected)
 
     @parameterized.parameterized.expand(
         [
@@ -137,15 +164,10 @@ class TestRequirements(unittest.TestCase):
             "default" if supplemental_scheme is None else supplemental_scheme
         ]
         self.assertListEqual(x.requirements, expected_requirements)
-        venv_packages = []
-        for entry in x.requirements:
-            if const.FROM_PACKAGES in entry:
-                venv_packages.extend(entry[const.FROM_PACKAGES])
-        self.assertIn("pip", venv_packages)
-        self.assertIn("setuptools", venv_packages)
-        self.assertIn("wheel", venv_packages)
+        expected_packages = {"pip", "setuptools", "wheel"}
         if expect_build_package:
-            self.assertIn("build", venv_packages)
+            expected_packages.add("build")
+        self.assertLessEqual(expected_packages, _venv_packages(supplemental_scheme))
 
     def test_PV_RQ_022_get_requirements_raises(self):
         self._set_dummy_requirements()
@@ -203,8 +225,7 @@ class TestRequirements(unittest.TestCase):
     # TODO: Better testing of reqs.ReqScheme().fulfill()
 
     def test_PV_RQ_60_pip_argify_files(self):
-        self._set_dummy_requirements()
-        x = reqs.ReqScheme("dummy_req_scheme")
+        x = _dummy_scheme()
         files = ["dummy_one", "dummy_two"]
         expected = ["-r", "dummy_one", "-r", "dummy_two"]
         result = x._pip_argify_files(files)
@@ -230,8 +251,7 @@ class TestRequirements(unittest.TestCase):
         ]
     )
     def test_PV_RQ_70_get_requirements_files(self, name, entry, expected):
-        self._set_dummy_requirements()
-        x = reqs.ReqScheme("dummy_req_scheme")
+        x = _dummy_scheme()
         result = x._get_requirements_files(entry)
         self.assertListEqual(result, expected)
 
@@ -260,8 +280,7 @@ class TestRequirements(unittest.TestCase):
         ]
     )
     def test_PV_RQ_71_get_requirements_packages(self, name, entry, expected):
-        self._set_dummy_requirements()
-        x = reqs.ReqScheme("dummy_req_scheme", basename="dummy")
+        x = _dummy_scheme(basename="dummy")
         result = x._get_requirements_packages(entry)
         self.assertListEqual(result, expected)
 
@@ -296,8 +315,7 @@ class TestRequirements(unittest.TestCase):
         ]
     )
     def test_PV_RQ_72_get_requirements_commands(self, name, entry, expected):
-        self._set_dummy_requirements()
-        x = reqs.ReqScheme("dummy_req_scheme", python="schmython")
+        x = _dummy_scheme(python="schmython")
         result = x._get_requirements_commands(entry)
         self.assertListEqual(result, expected)
 
@@ -331,8 +349,7 @@ class TestRequirements(unittest.TestCase):
         ]
     )
     def test_PV_RQ_73_get_requirements_pip_args(self, name, entry, pip_args, expected):
-        self._set_dummy_requirements()
-        x = reqs.ReqScheme("dummy_req_scheme", pip_args=pip_args, basename="dummy")
+        x = _dummy_scheme(pip_args=tuple(pip_args), basename="dummy")
         result = x._get_requirements_pip_args(entry)
         self.assertListEqual(result, expected)
 
@@ -385,8 +402,7 @@ class TestRequirements(unittest.TestCase):
         ]
     )
     def test_PV_RQ_80_collect_pip_arguments(self, name, entry, pip_args, expected):
-        self._set_dummy_requirements()
-        x = reqs.ReqScheme("dummy_req_scheme", pip_args=pip_args, basename="dummy")
+        x = _dummy_scheme(pip_args=tuple(pip_args), basename="dummy")
         result = x._collect_pip_arguments(entry)
         self.assertListEqual(result, expected)
 
@@ -421,8 +437,7 @@ class TestRequirements(unittest.TestCase):
         ]
     )
     def test_PV_RQ_81_collect_commands(self, name, entry, expected):
-        self._set_dummy_requirements()
-        x = reqs.ReqScheme("dummy_req_scheme", python="schmython")
+        x = _dummy_scheme(python="schmython")
         result = x._collect_commands(entry)
         self.assertListEqual(result, expected)
 
@@ -450,8 +465,7 @@ class TestRequirements(unittest.TestCase):
         ]
     )
     def test_PV_RQ_82_collect_bdist_wheel(self, name, entry, expected):
-        self._set_dummy_requirements()
-        x = reqs.ReqScheme("dummy_req_scheme", python="schmython")
+        x = _dummy_scheme(python="schmython")
         result = x._collect_bdist_wheel(entry)
         self.assertListEqual(result, expected)
 
@@ -479,8 +493,7 @@ class TestRequirements(unittest.TestCase):
         ]
     )
     def test_PV_RQ_83_collect_sdist(self, name, entry, expected):
-        self._set_dummy_requirements()
-        x = reqs.ReqScheme("dummy_req_scheme", python="schmython")
+        x = _dummy_scheme(python="schmython")
         result = x._collect_sdist(entry)
         self.assertListEqual(result, expected)
 
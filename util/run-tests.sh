@@ -3,7 +3,28 @@
 set -e
 set -u
 
-# https://docs.python.org/3/library/unittest.html#test-discovery
+# https://docs.pytest.org/en/stable/how-to/unittest.html
+# https://pytest-xdist.readthedocs.io/en/stable/distribution.html
+#
+# The tests are dominated by waiting on `python -m venv`, `pip`, `conda`,
+# and `pyenv` subprocesses, so spread them across worker processes.  Leave
+# two cores free for everything else; override with PYTEST_WORKERS.
+# `--dist=loadscope` keeps each test class on a single worker, so a class's
+# `setUpClass()`/`tearDownClass()` run once and its patches to module-level
+# state such as `reqs.REQUIREMENTS` stay within that worker's process.
+#
+# Test projects are built with `tempfile`, so they honor TMPDIR.  To keep
+# them off a slow disk, point TMPDIR at a tmpfs, provided it allows
+# executables (the tests create virtual environments inside them):
+#
+#     TMPDIR=/dev/shm util/run-tests.sh
+
+if [ -z "${PYTEST_WORKERS:-}" ]; then
+    PYTEST_WORKERS=$(( $(nproc 2>/dev/null || echo 3) - 2 ))
+    if [ "${PYTEST_WORKERS}" -lt 1 ]; then
+        PYTEST_WORKERS=1
+    fi
+fi
 
 set -x
-python3 -m unittest discover -s tests -t . -v ${1:+"$@"}
+python3 -m pytest -n "${PYTEST_WORKERS}" --dist=loadscope ${1:+"$@"}
@@ -84,11 +84,8 @@ def _write_ini_file(filename, section, key, requirements_list):
 
 
 def _read_text_file(filename):
-    requirements = []
     with open(filename, "r", encoding="utf-8") as infile:
-        for line in infile:
-            requirements.append(line.strip())
-    return requirements
+        return [line.strip() for line in infile.read().splitlines()]
 
 
 def _write_text_file(filename, requirements_list):
@@ -172,7 +169,8 @@ def _sync_requirements(
                 tofile=source_file,
                 lineterm="",
             )
-            print("\n".join(differences))
+            for line in differences:
+                print(line)
         status = STATUS_CHANGED
     return status
 
@@ -50,12 +50,13 @@ RELEASE_TYPES_REQUIRING_SEPARATOR = {"dev"}
 
 def _get_version_from_file(version_file):
     """Return the version as read from `version_file`"""
-    version = version_file.read().lstrip().splitlines()
-    if not version:
-        raise RuntimeError(
-            "{path}: version file appears to be blank".format(path=version_file.path)
-        )
-    return version[0].rstrip()
+    for line in version_file:
+        version = line.strip()
+        if version:
+            return version
+    raise RuntimeError(
+        "{path}: version file appears to be blank".format(path=version_file.name)
+    )
 
 
 def _bumpversion_in_use():
@@ -64,7 +65,7 @@ def _bumpversion_in_use():
         if os.path.exists(config_filename):
             config_file = configparser.ConfigParser()
             config_file.read(config_filename)
-            if "bumpversion" in config_file:
+            if config_file.has_section("bumpversion"):
                 return True
     return False
 